@@ -0,0 +1,88 @@
+"""
+Rebuild materialized interview reports.
+
+Regenerates the stored report of completed interviews from their scores
+with the current report logic (interview_completion.build_report). Run it
+after changing the report layout or rules and bumping REPORT_VERSION.
+
+Usage (from backend/):
+    python -m app.commands.rebuild_reports [--interview-id 42] [--missing-only] [--dry-run]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import time
+
+from sqlalchemy import select, update
+
+from app.database import AsyncSessionLocal
+from app.models.interview import Interview
+from app.services.interview_completion import REPORT_VERSION, load_interview_report, serialize_report
+
+logger = logging.getLogger(__name__)
+
+def _is_current(report_json: str) -> bool:
+    try:
+        return json.loads(report_json).get("version") == REPORT_VERSION
+    except (TypeError, ValueError):
+        return False
+
+async def rebuild(
+    interview_id: int = None,
+    missing_only: bool = False,
+    force: bool = False,
+    dry_run: bool = False,
+    chunk_size: int = 500
+) -> int:
+    """Rebuild reports that are missing or outdated; returns reports written"""
+    query = (
+        select(Interview.id, Interview.report)
+        .where(Interview.status == "completed")
+        .order_by(Interview.id)
+        .execution_options(yield_per=chunk_size)
+    )
+    if interview_id is not None:
+        query = query.where(Interview.id == interview_id)
+    if missing_only:
+        query = query.where(Interview.report.is_(None))
+
+    rebuilt = 0
+    started = time.perf_counter()
+
+    # Separate sessions: one holds the streaming cursor, the other commits updates
+    async with AsyncSessionLocal() as read_session, AsyncSessionLocal() as write_session:
+        result = await read_session.stream(query)
+        async for rows in result.partitions(chunk_size):
+            for row in rows:
+                if not force and row.report is not None and _is_current(row.report):
+                    continue
+
+                report = await load_interview_report(write_session, row.id)
+                if report is None or dry_run:
+                    continue
+                await write_session.execute(
+                    update(Interview)
+                    .where(Interview.id == row.id)
+                    .values(report=serialize_report(report))
+                )
+                rebuilt += 1
+
+            if not dry_run:
+                await write_session.commit()
+            logger.info(f"Rebuilt {rebuilt} reports ({time.perf_counter() - started:.1f}s)")
+
+    return rebuilt
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--interview-id", type=int, default=None)
+    parser.add_argument("--missing-only", action="store_true", help="only interviews without a stored report")
+    parser.add_argument("--force", action="store_true", help="rebuild reports already at the current version")
+    parser.add_argument("--dry-run", action="store_true", help="build reports without writing them")
+    args = parser.parse_args()
+
+    total = asyncio.run(rebuild(args.interview_id, args.missing_only, args.force, args.dry_run))
+    logger.info(f"Done: {total} reports rebuilt")
@@ -0,0 +1,130 @@
+"""
+Rescore stored interview responses with the current heuristics.
+
+Only responses whose score came from the heuristics are rescored; scores
+from the LLM (and rows predating score_source) are kept unless
+--include-llm is passed. Streams interview_responses rows with a server-side cursor, scores each
+chunk with response_analyzer.analyze_responses_batch and writes score and
+feedback back with one bulk UPDATE per chunk. Completed interviews whose
+responses were rescored then get their aggregate scores recomputed and
+their materialized report rebuilt, so neither goes stale.
+
+Usage (from backend/):
+    python -m app.commands.rescore_responses --chunk-size 1000 [--interview-id 42] [--include-llm] [--dry-run]
+"""
+import argparse
+import asyncio
+import logging
+import time
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import AsyncSessionLocal
+from app.models.interview import Interview, InterviewQuestion, InterviewResponse
+from app.services.interview_completion import (
+    finalize_interview_scores,
+    load_interview_report,
+    serialize_report
+)
+from app.services.response_analyzer import analyze_responses_batch
+
+logger = logging.getLogger(__name__)
+
+async def rescore(
+    chunk_size: int,
+    interview_id: int = None,
+    dry_run: bool = False,
+    include_llm: bool = False
+) -> int:
+    """Rescore all (or one interview's) heuristic responses; returns rows processed"""
+    query = (
+        select(
+            InterviewResponse.id,
+            InterviewResponse.answer,
+            InterviewResponse.interview_id,
+            InterviewQuestion.category,
+            Interview.difficulty,
+            Interview.status.label("interview_status")
+        )
+        .join(InterviewQuestion, InterviewResponse.question_id == InterviewQuestion.id)
+        .join(Interview, InterviewResponse.interview_id == Interview.id)
+        .order_by(InterviewResponse.id)
+        .execution_options(yield_per=chunk_size)
+    )
+    if interview_id is not None:
+        query = query.where(InterviewResponse.interview_id == interview_id)
+    if not include_llm:
+        query = query.where(InterviewResponse.score_source == "heuristic")
+
+    processed = 0
+    completed_ids = set()
+    started = time.perf_counter()
+
+    # Separate sessions: one holds the streaming cursor, the other commits updates
+    async with AsyncSessionLocal() as read_session, AsyncSessionLocal() as write_session:
+        result = await read_session.stream(query)
+        async for rows in result.partitions(chunk_size):
+            analyses = analyze_responses_batch(
+                answers=[row.answer for row in rows],
+                categories=[row.category for row in rows],
+                difficulties=[row.difficulty or "medium" for row in rows]
+            )
+
+            if not dry_run:
+                # A job may have stored an LLM score since the row was read
+                statement = update(InterviewResponse)
+                if not include_llm:
+                    statement = statement.where(
+                        InterviewResponse.score_source == "heuristic"
+                    ).execution_options(synchronize_session=None)
+                await write_session.execute(
+                    statement,
+                    [
+                        {
+                            "id": row.id,
+                            "score": analysis["score"],
+                            "feedback": analysis["feedback"],
+                            "score_source": "heuristic"
+                        }
+                        for row, analysis in zip(rows, analyses)
+                    ]
+                )
+                await write_session.commit()
+
+            completed_ids.update(row.interview_id for row in rows if row.interview_status == "completed")
+            processed += len(rows)
+            rate = processed / (time.perf_counter() - started)
+            logger.info(f"Rescored {processed} responses ({rate:.0f} rows/s)")
+
+        if not dry_run:
+            for completed_id in sorted(completed_ids):
+                await refinalize(write_session, completed_id)
+                await write_session.commit()
+            logger.info(f"Refinalized {len(completed_ids)} completed interviews")
+
+    return processed
+
+async def refinalize(db: AsyncSession, interview_id: int) -> None:
+    """Recompute a completed interview's scores and report from its responses"""
+    await finalize_interview_scores(db, interview_id)
+    report = await load_interview_report(db, interview_id)
+    if report is not None:
+        await db.execute(
+            update(Interview)
+            .where(Interview.id == interview_id)
+            .values(report=serialize_report(report))
+        )
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--interview-id", type=int, default=None)
+    parser.add_argument("--include-llm", action="store_true", help="also replace LLM and legacy scores")
+    parser.add_argument("--dry-run", action="store_true", help="score without writing results")
+    args = parser.parse_args()
+
+    total = asyncio.run(rescore(args.chunk_size, args.interview_id, args.dry_run, args.include_llm))
+    logger.info(f"Done: {total} responses {'scored (dry run)' if args.dry_run else 'rescored'}")
@@ -5,15 +5,31 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+def _create_engine(url: str):
+    connect_args = {"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+    if settings.DB_STATEMENT_CACHE_SIZE == 0:
+        # Also disable asyncpg's own cache, e.g. behind pgbouncer in transaction mode
+        connect_args["statement_cache_size"] = 0
+
+    return create_async_engine(
+        url,
+        echo=settings.DEBUG,
+        future=True,
+        pool_pre_ping=True,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        connect_args=connect_args,
+    )
+
 # Create async engine
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    future=True,
-    pool_pre_ping=True,
-)
+engine = _create_engine(settings.DATABASE_URL)
 
-# Create async session factory
+# Read-only traffic goes to the replica when one is configured
+read_engine = _create_engine(settings.DATABASE_READ_URL) if settings.DATABASE_READ_URL else engine
+
+# Create async session factories
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -22,6 +38,14 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+AsyncReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
 # Base class for models
 Base = declarative_base()
 
@@ -37,6 +61,22 @@ async def get_db():
         finally:
             await session.close()
 
+async def get_read_db():
+    """
+    Dependency for getting a read-only database session
+
+    Served by DATABASE_READ_URL when set, so it may lag the primary slightly;
+    use get_db where a request must see its own recent writes.
+    """
+    async with AsyncReadSessionLocal() as session:
+        try:
+            yield session
+        except Exception as e:
+            logger.error(f"Database session error: {e}")
+            raise
+        finally:
+            await session.close()
+
 async def init_db():
     """Initialize database tables"""
     async with engine.begin() as conn:
@@ -2,11 +2,22 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
+import asyncio
 import logging
 
 from app.config import settings
-from app.routers import auth, resume, interview
+from app.routers import auth, resume, interview, jobs
 from app.middleware.error_handler import global_exception_handler, validation_exception_handler
+from app.middleware.rate_limit import RateLimitMiddleware, rate_limiter
+from app.services.llm_cache import get_cache_stats
+from app.services.job_queue import analysis_backlog
+from app.services.llm_service import get_llm_stats
+from app.services.notifier import notifier
+from app.services.resume_parser import parse_executor
+from app.services.token_revocation import revocation_list
+from app.services.transcription_engine import transcription_engine
+from app.utils.auth import get_auth_cache_stats, sync_user_invalidations
+from app.utils.security import auth_executor
 
 # Configure logging
 logging.basicConfig(
@@ -22,6 +33,9 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Rate limiting; added before CORS so rejections still carry CORS headers
+app.add_middleware(RateLimitMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -29,6 +43,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor", "Retry-After"],
 )
 
 @app.exception_handler(RequestValidationError)
@@ -68,10 +83,32 @@ async def global_exception_handler_wrapper(request: Request, exc: Exception):
         }
     )
 
+@app.on_event("startup")
+async def startup():
+    """Warm up models configured for preloading and start background sync"""
+    if settings.TRANSCRIPTION_PRELOAD:
+        # Load in the background so the API starts serving immediately
+        app.state.transcription_warmup = asyncio.create_task(transcription_engine.load())
+    app.state.revocation_sync = asyncio.create_task(revocation_list.run())
+    app.state.backlog_sync = asyncio.create_task(analysis_backlog.run())
+    app.state.user_sync = asyncio.create_task(sync_user_invalidations())
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Release background executors and connections"""
+    app.state.revocation_sync.cancel()
+    app.state.backlog_sync.cancel()
+    app.state.user_sync.cancel()
+    transcription_engine.shutdown()
+    auth_executor.shutdown()
+    parse_executor.shutdown()
+    await notifier.close()
+
 # Include routers
 app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
 app.include_router(resume.router, prefix="/api/resume", tags=["resume"])
 app.include_router(interview.router, prefix="/api/interview", tags=["interview"])
+app.include_router(jobs.router, prefix="/api/jobs", tags=["jobs"])
 
 @app.get("/health")
 async def health_check():
@@ -82,6 +119,31 @@ async def health_check():
         "version": "1.0.0"
     }
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe; not ready until preloaded models are loaded"""
+    if settings.TRANSCRIPTION_PRELOAD and not transcription_engine.ready:
+        return JSONResponse(
+            status_code=503,
+            content={"status": "loading", "transcription": transcription_engine.stats()}
+        )
+    return {"status": "ready", "transcription_ready": transcription_engine.ready}
+
+@app.get("/metrics")
+async def metrics():
+    """Runtime metrics for caches and background services"""
+    return {
+        "llm_cache": get_cache_stats(),
+        "llm_requests": get_llm_stats(),
+        "transcription": transcription_engine.stats(),
+        "auth_crypto": auth_executor.stats(),
+        "auth_cache": get_auth_cache_stats(),
+        "revoked_tokens": revocation_list.stats(),
+        "resume_parse": parse_executor.stats(),
+        "rate_limits": rate_limiter.stats(),
+        "analysis_backlog": analysis_backlog.stats()
+    }
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -0,0 +1,245 @@
+import json
+import logging
+import math
+import time
+from datetime import timedelta
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs
+
+from sqlalchemy import Float, case, cast, delete, func
+from sqlalchemy.dialects.postgresql import insert
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.rate_limit import RateLimitBucket
+from app.services.job_queue import analysis_backlog
+from app.services.resume_parser import parse_executor
+from app.utils.auth import get_token_claims
+from app.utils.cache import TTLCache
+from app.utils.security import auth_executor
+
+logger = logging.getLogger(__name__)
+
+# (method, path prefix, route class); WEBSOCKET matches WebSocket handshakes
+ROUTE_CLASSES = [
+    ("POST", "/api/auth/login", "auth"),
+    ("POST", "/api/auth/signup", "auth"),
+    ("POST", "/api/resume/upload", "upload"),
+    ("POST", "/api/resume/analyze-ats/", "ats"),
+    ("POST", "/api/interview/submit-response", "scoring"),
+    ("POST", "/api/interview/complete/", "scoring"),
+    ("WEBSOCKET", "/api/interview/session/", "scoring"),
+    ("WEBSOCKET", "/api/interview/live-score/", "scoring"),
+    ("WEBSOCKET", "/api/interview/transcribe/", "transcription")
+]
+
+# Executors and queues whose backlog makes further requests of a class pointless
+SHED_ON = {
+    "auth": auth_executor,
+    "upload": parse_executor,
+    "scoring": analysis_backlog
+}
+
+def route_class(method: str, path: str) -> Optional[str]:
+    for route_method, prefix, name in ROUTE_CLASSES:
+        if method == route_method and path.startswith(prefix):
+            return name
+    return None
+
+class MemoryBuckets:
+    """
+    Per-process token buckets
+
+    A bucket is only stored while it is below burst; its entry expires when
+    it would have refilled, so idle clients cost no memory.
+    """
+
+    def __init__(self, max_entries: int = 100000):
+        self._buckets = TTLCache(max_entries=max_entries)
+
+    async def take(self, key: str, rate: float, burst: float) -> float:
+        """Take a token; returns 0 if allowed, else seconds until one is available"""
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(key) or (burst, now)
+        tokens = min(burst, tokens + (now - updated) * rate)
+
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / rate
+
+        self._buckets.set(key, (tokens, now), ttl_seconds=(burst - tokens) / rate)
+        return wait
+
+class PostgresBuckets:
+    """
+    Token buckets shared by all workers, one row per key
+
+    Refill, take and the allow decision happen in a single UPSERT, so
+    concurrent requests for the same key serialize on the row lock.
+    """
+
+    def __init__(self, prune_seconds: float = 300):
+        self.prune_seconds = prune_seconds
+        self._last_prune = time.monotonic()
+
+    async def take(self, key: str, rate: float, burst: float) -> float:
+        elapsed = cast(func.extract("epoch", func.now() - RateLimitBucket.updated_at), Float)
+        refilled = func.least(burst, RateLimitBucket.tokens + elapsed * rate)
+        statement = (
+            insert(RateLimitBucket)
+            .values(key=key, tokens=burst - 1, allowed=True, updated_at=func.now())
+            .on_conflict_do_update(
+                index_elements=[RateLimitBucket.key],
+                set_={
+                    "tokens": case((refilled >= 1, refilled - 1), else_=refilled),
+                    "allowed": refilled >= 1,
+                    "updated_at": func.now()
+                }
+            )
+            .returning(RateLimitBucket.tokens, RateLimitBucket.allowed)
+        )
+
+        async with AsyncSessionLocal() as db:
+            row = (await db.execute(statement)).one()
+            if time.monotonic() - self._last_prune >= self.prune_seconds:
+                await self._prune(db)
+            await db.commit()
+
+        return 0.0 if row.allowed else (1 - row.tokens) / rate
+
+    async def _prune(self, db) -> None:
+        # Rows idle this long are full again under every configured limit
+        idle_seconds = max(
+            (limit["burst"] * 60 / limit["per_minute"] for limit in settings.RATE_LIMITS.values()),
+            default=0
+        )
+        await db.execute(
+            delete(RateLimitBucket).where(
+                RateLimitBucket.updated_at < func.now() - timedelta(seconds=idle_seconds)
+            )
+        )
+        self._last_prune = time.monotonic()
+
+class RateLimiter:
+    """Token-bucket limits and load shedding by route class"""
+
+    def __init__(self, limits: Dict[str, Dict[str, float]], shared: bool = False):
+        self.limits = limits
+        self.memory = MemoryBuckets()
+        self.shared = PostgresBuckets() if shared else None
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, name: str, outcome: str) -> None:
+        counters = self._counters.setdefault(name, {"allowed": 0, "limited": 0, "shed": 0})
+        counters[outcome] += 1
+
+    async def check(self, name: str, client: str) -> Optional[Tuple[int, int]]:
+        """None if the request may proceed, else (status code, Retry-After seconds)"""
+        executor = SHED_ON.get(name)
+        if executor is not None and executor.saturated:
+            self._count(name, "shed")
+            return 503, executor.retry_after()
+
+        limit = self.limits.get(name)
+        if limit is None:
+            return None
+
+        key = f"{name}:{client}"
+        rate = limit["per_minute"] / 60
+        if self.shared is not None:
+            try:
+                wait = await self.shared.take(key, rate, limit["burst"])
+            except Exception as e:
+                # Fail over to per-process limits rather than rejecting or not limiting
+                logger.warning(f"Shared rate limit unavailable, using local buckets: {e}")
+                wait = await self.memory.take(key, rate, limit["burst"])
+        else:
+            wait = await self.memory.take(key, rate, limit["burst"])
+
+        if wait > 0:
+            self._count(name, "limited")
+            return 429, max(1, math.ceil(wait))
+        self._count(name, "allowed")
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return outcomes per route class for monitoring"""
+        return {
+            "backend": "postgres" if self.shared is not None else "memory",
+            "classes": self._counters
+        }
+
+rate_limiter = RateLimiter(settings.RATE_LIMITS, shared=settings.RATE_LIMIT_SHARED)
+
+def client_key(scope: Dict[str, Any], headers: Dict[str, str]) -> str:
+    """user:<id> for a valid bearer or query token, else ip:<address>"""
+    token = None
+    authorization = headers.get("authorization", "")
+    if authorization.lower().startswith("bearer "):
+        token = authorization[7:]
+    elif scope["type"] == "websocket":
+        token = parse_qs(scope.get("query_string", b"").decode()).get("token", [None])[0]
+
+    if token:
+        claims = get_token_claims(token)
+        if claims and claims.get("sub"):
+            return f"user:{claims['sub']}"
+
+    forwarded = headers.get("x-forwarded-for")
+    if settings.RATE_LIMIT_TRUST_FORWARDED and forwarded:
+        return f"ip:{forwarded.split(',')[0].strip()}"
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware applying rate_limiter to the routes in ROUTE_CLASSES
+
+    Requests over their bucket get 429 and overloaded classes get 503, both
+    with Retry-After and before the body is read. WebSocket handshakes are
+    refused with close code 1013 (try again later).
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if not settings.RATE_LIMIT_ENABLED or scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        method = "WEBSOCKET" if scope["type"] == "websocket" else scope["method"]
+        name = route_class(method, scope["path"])
+        if name is None:
+            await self.app(scope, receive, send)
+            return
+
+        headers = {k.decode("latin-1"): v.decode("latin-1") for k, v in scope["headers"]}
+        rejected = await rate_limiter.check(name, client_key(scope, headers))
+        if rejected is None:
+            await self.app(scope, receive, send)
+            return
+
+        status_code, retry_after = rejected
+        if scope["type"] == "websocket":
+            await receive()  # websocket.connect
+            await send({"type": "websocket.close", "code": 1013})
+            return
+
+        body = json.dumps({
+            "error": "Too Many Requests" if status_code == 429 else "Service Unavailable",
+            "message": "Rate limit exceeded" if status_code == 429 else "Server is busy",
+            "retry_after": retry_after
+        }).encode()
+        await send({
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(retry_after).encode())
+            ]
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -2,5 +2,8 @@
 from app.models.user import User
 from app.models.resume import Resume
 from app.models.interview import Interview, InterviewQuestion, InterviewResponse
+from app.models.job import Job
+from app.models.revoked_token import RevokedToken
+from app.models.rate_limit import RateLimitBucket
 
-__all__ = ["User", "Resume", "Interview", "InterviewQuestion", "InterviewResponse"]
+__all__ = ["User", "Resume", "Interview", "InterviewQuestion", "InterviewResponse", "Job", "RevokedToken", "RateLimitBucket"]
@@ -16,6 +16,7 @@ class Interview(Base):
     technical_score = Column(Float, default=0.0)
     duration = Column(Integer, default=0)  # in seconds
     status = Column(String, default="in_progress")  # in_progress, completed
+    report = Column(Text, nullable=True)  # JSON string, built at completion
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -54,6 +55,8 @@ class InterviewResponse(Base):
     duration = Column(Integer, default=0)  # in seconds
     score = Column(Float, default=0.0)
     feedback = Column(Text, nullable=True)
+    status = Column(String, default="analyzed")  # pending, analyzed
+    score_source = Column(String, default="heuristic")  # heuristic, llm; NULL for rows predating the column
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # Relationships
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from datetime import datetime
+from app.database import Base
+
+class Job(Base):
+    __tablename__ = "jobs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    job_type = Column(String, nullable=False)
+    payload = Column(Text, nullable=False)  # JSON string
+    priority = Column(Integer, default=0)  # higher runs first
+    status = Column(String, default="queued")  # queued, running, succeeded, failed
+    attempts = Column(Integer, default=0)
+    max_attempts = Column(Integer, default=5)
+    run_at = Column(DateTime, default=datetime.utcnow)  # not claimed before this time
+    locked_until = Column(DateTime, nullable=True)  # visibility timeout of the current claim
+    locked_by = Column(String, nullable=True)
+    last_error = Column(Text, nullable=True)
+    result = Column(Text, nullable=True)  # JSON string
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+    
+    def __repr__(self):
+        return f"<Job(id={self.id}, job_type={self.job_type}, status={self.status})>"
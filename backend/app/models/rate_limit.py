@@ -0,0 +1,14 @@
+from sqlalchemy import Column, String, Float, Boolean, DateTime
+from datetime import datetime
+from app.database import Base
+
+class RateLimitBucket(Base):
+    __tablename__ = "rate_limit_buckets"
+    
+    key = Column(String, primary_key=True)  # route class and user or IP
+    tokens = Column(Float, nullable=False)
+    allowed = Column(Boolean, default=True)  # outcome of the last request
+    updated_at = Column(DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<RateLimitBucket(key={self.key}, tokens={self.tokens})>"
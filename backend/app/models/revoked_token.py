@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from datetime import datetime
+from app.database import Base
+
+class RevokedToken(Base):
+    __tablename__ = "revoked_tokens"
+    
+    id = Column(Integer, primary_key=True, index=True)  # change cursor for in-memory mirrors
+    jti = Column(String, unique=True, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    expires_at = Column(DateTime, nullable=False)  # prunable once the token itself has expired
+    revoked_at = Column(DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<RevokedToken(id={self.id}, jti={self.jti}, expires_at={self.expires_at})>"
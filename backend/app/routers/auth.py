@@ -1,20 +1,22 @@
 from fastapi import APIRouter, HTTPException, status, Depends
-from fastapi.security import HTTPBearer
 from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from pydantic import BaseModel, EmailStr
+from typing import Any, Dict
 from datetime import timedelta
 import logging
 
 from app.database import get_db
 from app.models.user import User
-from app.utils.security import hash_password, verify_password, create_access_token, decode_token
+from app.utils.auth import security, get_token_claims, get_current_user as current_user_profile
+from app.utils.executors import ExecutorSaturated
+from app.services.token_revocation import revoke_token
+from app.utils.security import hash_password_async, verify_and_update_password, create_access_token
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
-security = HTTPBearer()
 
 class LoginRequest(BaseModel):
     email: EmailStr
@@ -38,6 +40,14 @@ class UserResponse(BaseModel):
     full_name: str
     is_active: bool
 
+def crypto_unavailable(exc: ExecutorSaturated) -> HTTPException:
+    """503 telling the client when to retry a saturated password check"""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication is busy, please retry shortly",
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
 @router.post("/signup", response_model=TokenResponse)
 async def signup(request: SignupRequest, db: AsyncSession = Depends(get_db)):
     """User signup endpoint"""
@@ -53,7 +63,10 @@ async def signup(request: SignupRequest, db: AsyncSession = Depends(get_db)):
             )
         
         # Create new user
-        hashed_password = hash_password(request.password)
+        try:
+            hashed_password = await hash_password_async(request.password)
+        except ExecutorSaturated as e:
+            raise crypto_unavailable(e)
         new_user = User(
             email=request.email,
             full_name=request.full_name,
@@ -97,7 +110,18 @@ async def login(request: LoginRequest, db: AsyncSession = Depends(get_db)):
         result = await db.execute(select(User).where(User.email == request.email))
         user = result.scalar_one_or_none()
         
-        if not user or not verify_password(request.password, user.hashed_password):
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid email or password"
+            )
+        
+        try:
+            valid, new_hash = await verify_and_update_password(request.password, user.hashed_password)
+        except ExecutorSaturated as e:
+            raise crypto_unavailable(e)
+        
+        if not valid:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password"
@@ -109,6 +133,12 @@ async def login(request: LoginRequest, db: AsyncSession = Depends(get_db)):
                 detail="User account is inactive"
             )
         
+        # Upgrade hashes made with outdated parameters while we have the password
+        if new_hash:
+            user.hashed_password = new_hash
+            await db.commit()
+            logger.info(f"Rehashed password for user {user.id}")
+        
         # Create access token
         access_token = create_access_token(
             data={"sub": str(user.id), "email": user.email}
@@ -133,47 +163,30 @@ async def login(request: LoginRequest, db: AsyncSession = Depends(get_db)):
         )
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user(
+async def get_current_user(user: Dict[str, Any] = Depends(current_user_profile)):
+    """Get current user information"""
+    return UserResponse(**user)
+
+@router.post("/logout")
+async def logout(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get current user information"""
+    """User logout endpoint; revokes the access token"""
+    payload = get_token_claims(credentials.credentials)
+    if not payload:
+        # Already invalid, expired or revoked
+        return {"message": "Logged out successfully"}
+    
     try:
-        token = credentials.credentials
-        payload = decode_token(token)
-        
-        if not payload:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid or expired token"
-            )
-        
-        user_id = payload.get("sub")
-        result = await db.execute(select(User).where(User.id == int(user_id)))
-        user = result.scalar_one_or_none()
-        
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found"
-            )
-        
-        return UserResponse(
-            id=user.id,
-            email=user.email,
-            full_name=user.full_name,
-            is_active=user.is_active
-        )
-    except HTTPException:
-        raise
+        await revoke_token(db, payload)
+        await db.commit()
     except Exception as e:
-        logger.error(f"Get user error: {str(e)}")
+        logger.error(f"Logout error: {str(e)}")
+        await db.rollback()
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token"
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error during logout"
         )
-
-@router.post("/logout")
-async def logout():
-    """User logout endpoint"""
+    
     return {"message": "Logged out successfully"}
@@ -1,22 +1,40 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from pydantic import BaseModel
+from sqlalchemy import select, insert, values, column, literal, true, Integer, String, Text, DateTime
+from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import datetime
+import asyncio
+import hashlib
 import logging
 import json
+import os
 
-from app.database import get_db
+from app.config import settings
+from app.database import get_db, get_read_db, AsyncSessionLocal
 from app.models.interview import Interview, InterviewQuestion, InterviewResponse
-from app.utils.security import decode_token
+from app.utils.auth import security, get_active_user_id, get_current_user_id, get_token_claims
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, keyset_page, split_page
 from app.services.question_generator import generate_interview_questions
-from app.services.response_analyzer import analyze_response
+from app.services.response_analyzer import analyze_response, analyze_responses_batch
+from app.services.live_scoring import IncrementalAnswerState
+from app.services.interview_session import InterviewSession
+from app.services.interview_completion import (
+    complete_interview_analysis,
+    load_interview_report,
+    serialize_report
+)
+from app.services.notifier import RESPONSE_ANALYZED, notifier
+from app.services.job_queue import enqueue, enqueue_many
+from app.services.streaming_transcriber import RecordingTooLong, StreamingTranscription, SAMPLE_RATE
+from app.services.transcription_engine import transcription_engine
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
-security = HTTPBearer()
+
+# Largest batch accepted by /submit-responses; interviews have far fewer questions
+MAX_BATCH_RESPONSES = 50
 
 class InterviewSetupRequest(BaseModel):
     job_title: str
@@ -38,6 +56,22 @@ class ResponseAnalysisResponse(BaseModel):
     score: float
     feedback: str
     quality_metrics: dict
+    id: Optional[int] = None
+    status: str = "analyzed"
+
+class BatchSubmitRequest(BaseModel):
+    responses: List[SubmitResponseRequest] = Field(max_length=MAX_BATCH_RESPONSES)
+
+class BatchSubmittedResponse(ResponseAnalysisResponse):
+    question_id: int
+
+class ResponseStatusResponse(BaseModel):
+    id: int
+    interview_id: int
+    question_id: int
+    status: str
+    score: Optional[float] = None
+    feedback: Optional[str] = None
 
 class InterviewReportResponse(BaseModel):
     overall_score: float
@@ -46,19 +80,8 @@ class InterviewReportResponse(BaseModel):
     duration: int
     strengths: List[str]
     improvements: List[str]
-
-async def get_current_user_id(credentials: HTTPAuthorizationCredentials = Depends(security)) -> int:
-    """Extract user ID from JWT token"""
-    token = credentials.credentials
-    payload = decode_token(token)
-    
-    if not payload:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token"
-        )
-    
-    return int(payload.get("sub"))
+    categories: dict = {}
+    questions: List[dict] = []
 
 @router.post("/setup")
 async def setup_interview(
@@ -66,9 +89,13 @@ async def setup_interview(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db)
 ):
-    """Setup mock interview session"""
+    """
+    Setup mock interview session
+
+    Returns the generated questions, so no follow-up GET /questions is needed.
+    """
     try:
-        user_id = await get_current_user_id(credentials)
+        user_id = await get_active_user_id(credentials, db)
         
         # Generate questions based on job description
         questions_data = generate_interview_questions(
@@ -78,38 +105,85 @@ async def setup_interview(
             count=5
         )
         
-        # Create interview record
-        new_interview = Interview(
-            user_id=user_id,
-            job_title=request.job_title,
-            job_description=request.job_description,
-            difficulty=request.difficulty,
-            status="in_progress"
-        )
-        
-        db.add(new_interview)
-        await db.flush()
+        if not questions_data:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="No questions generated"
+            )
         
-        # Create interview questions
-        for idx, q_data in enumerate(questions_data, 1):
-            question = InterviewQuestion(
-                interview_id=new_interview.id,
-                question_number=idx,
-                question=q_data["question"],
-                category=q_data["category"]
+        # Insert the interview and all its questions in one statement:
+        # the interview insert is a CTE whose RETURNING id feeds the questions
+        now = datetime.utcnow()
+        new_interview = (
+            insert(Interview)
+            .values(
+                user_id=user_id,
+                job_title=request.job_title,
+                job_description=request.job_description,
+                difficulty=request.difficulty,
+                overall_score=0.0,
+                communication_score=0.0,
+                technical_score=0.0,
+                duration=0,
+                status="in_progress",
+                created_at=now,
+                updated_at=now
             )
-            db.add(question)
+            .returning(Interview.id)
+            .cte("new_interview")
+        )
+        generated = values(
+            column("question_number", Integer),
+            column("question", Text),
+            column("category", String),
+            name="generated"
+        ).data([
+            (idx, q_data["question"], q_data["category"])
+            for idx, q_data in enumerate(questions_data, 1)
+        ])
         
+        result = await db.execute(
+            insert(InterviewQuestion)
+            .from_select(
+                ["interview_id", "question_number", "question", "category", "created_at"],
+                select(
+                    new_interview.c.id,
+                    generated.c.question_number,
+                    generated.c.question,
+                    generated.c.category,
+                    literal(now, DateTime)
+                )
+                .select_from(new_interview)
+                .join(generated, true())
+            )
+            .returning(
+                InterviewQuestion.id,
+                InterviewQuestion.interview_id,
+                InterviewQuestion.question_number,
+                InterviewQuestion.question,
+                InterviewQuestion.category
+            )
+        )
+        questions = sorted(result.all(), key=lambda q: q.question_number)
         await db.commit()
-        await db.refresh(new_interview)
         
+        interview_id = questions[0].interview_id
         logger.info(f"Interview setup completed for user {user_id}: {request.job_title}")
         
         return {
-            "interview_id": new_interview.id,
-            "job_title": new_interview.job_title,
-            "difficulty": new_interview.difficulty,
-            "total_questions": len(questions_data),
+            "interview_id": interview_id,
+            "job_title": request.job_title,
+            "difficulty": request.difficulty,
+            "total_questions": len(questions),
+            "questions": [
+                QuestionResponse(
+                    id=q.id,
+                    question_number=q.question_number,
+                    question=q.question,
+                    category=q.category
+                )
+                for q in questions
+            ],
             "message": "Interview session created successfully"
         }
     except HTTPException:
@@ -180,9 +254,16 @@ async def submit_response(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db)
 ):
-    """Submit and analyze interview response"""
+    """
+    Submit an interview response
+
+    The answer is stored with status "pending" and a provisional heuristic
+    score, and the request returns immediately. An analyze_response job
+    (see app.worker) replaces score and feedback; poll
+    GET /response/{id} or listen on /responses/{interview_id}/events.
+    """
     try:
-        user_id = await get_current_user_id(credentials)
+        user_id = await get_active_user_id(credentials, db)
         
         # Verify interview belongs to user
         result = await db.execute(
@@ -210,7 +291,7 @@ async def submit_response(
                 detail="Question not found"
             )
         
-        # Analyze response
+        # Provisional score; the heuristic takes microseconds
         analysis = analyze_response(
             question=question.question,
             answer=request.answer,
@@ -218,22 +299,27 @@ async def submit_response(
             difficulty=interview.difficulty
         )
         
-        # Save response
+        # Save response and queue its analysis in the same transaction
         new_response = InterviewResponse(
             interview_id=interview_id,
             question_id=question_id,
             answer=request.answer,
             duration=request.duration,
             score=analysis["score"],
-            feedback=analysis["feedback"]
+            feedback=analysis["feedback"],
+            status="pending"
         )
         
         db.add(new_response)
+        await db.flush()
+        await enqueue(db, "analyze_response", {"response_id": new_response.id}, user_id=user_id)
         await db.commit()
         
         logger.info(f"Response submitted for interview {interview_id}, question {question_id}")
         
         return ResponseAnalysisResponse(
+            id=new_response.id,
+            status=new_response.status,
             score=analysis["score"],
             feedback=analysis["feedback"],
             quality_metrics=analysis["quality_metrics"]
@@ -248,72 +334,190 @@ async def submit_response(
             detail="Error submitting response"
         )
 
-@router.post("/complete/{interview_id}")
-async def complete_interview(
+@router.post("/submit-responses/{interview_id}", response_model=List[BatchSubmittedResponse])
+async def submit_responses_batch(
     interview_id: int,
+    request: BatchSubmitRequest,
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db)
 ):
-    """Complete interview and generate report"""
+    """
+    Submit several answers for an interview at once
+
+    For clients that queue answers offline. Ownership is checked once, the
+    questions are fetched in one query, provisional scores are computed in
+    one vectorized pass, and all responses and their analysis jobs are
+    inserted in a single transaction.
+    """
+    user_id = await get_active_user_id(credentials, db)
+    
+    if not request.responses:
+        return []
+    
+    question_ids = [item.question_id for item in request.responses]
+    duplicates = sorted({qid for qid in question_ids if question_ids.count(qid) > 1})
+    if duplicates:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Duplicate answers for questions: {', '.join(map(str, duplicates))}"
+        )
+    
     try:
-        user_id = await get_current_user_id(credentials)
-        
-        # Get interview
         result = await db.execute(
-            select(Interview).where(
+            select(Interview.difficulty).where(
                 (Interview.id == interview_id) & (Interview.user_id == user_id)
             )
         )
-        interview = result.scalar_one_or_none()
+        difficulty = result.scalar_one_or_none()
         
-        if not interview:
+        if difficulty is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Interview not found"
             )
         
-        # Get all responses
         result = await db.execute(
-            select(InterviewResponse).where(InterviewResponse.interview_id == interview_id)
+            select(InterviewQuestion.id, InterviewQuestion.category).where(
+                (InterviewQuestion.interview_id == interview_id) &
+                (InterviewQuestion.id.in_(question_ids))
+            )
         )
-        responses = result.scalars().all()
+        categories = dict(result.all())
         
-        if not responses:
+        missing = sorted(set(question_ids) - categories.keys())
+        if missing:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No responses submitted"
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Questions not found: {', '.join(map(str, missing))}"
             )
         
-        # Calculate scores
-        scores = [r.score for r in responses]
-        overall_score = sum(scores) / len(scores) if scores else 0
+        # Provisional scores for all answers in one pass
+        analyses = analyze_responses_batch(
+            answers=[item.answer for item in request.responses],
+            categories=[categories[item.question_id] for item in request.responses],
+            difficulties=[difficulty] * len(request.responses)
+        )
         
-        # Categorize scores
-        communication_responses = [r for r in responses if r.question.category == "behavioral"]
-        technical_responses = [r for r in responses if r.question.category == "technical"]
+        result = await db.execute(
+            insert(InterviewResponse).returning(InterviewResponse.id, sort_by_parameter_order=True),
+            [
+                {
+                    "interview_id": interview_id,
+                    "question_id": item.question_id,
+                    "answer": item.answer,
+                    "duration": item.duration,
+                    "score": analysis["score"],
+                    "feedback": analysis["feedback"],
+                    "status": "pending"
+                }
+                for item, analysis in zip(request.responses, analyses)
+            ]
+        )
+        response_ids = list(result.scalars().all())
+        await enqueue_many(
+            db,
+            "analyze_response",
+            [{"response_id": response_id} for response_id in response_ids],
+            user_id=user_id
+        )
+        await db.commit()
+        
+        logger.info(f"Batch of {len(response_ids)} responses submitted for interview {interview_id}")
         
-        communication_score = (
-            sum(r.score for r in communication_responses) / len(communication_responses)
-            if communication_responses else overall_score
+        return [
+            BatchSubmittedResponse(
+                id=response_id,
+                question_id=item.question_id,
+                status="pending",
+                score=analysis["score"],
+                feedback=analysis["feedback"],
+                quality_metrics=analysis["quality_metrics"]
+            )
+            for response_id, item, analysis in zip(response_ids, request.responses, analyses)
+        ]
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error submitting responses: {str(e)}")
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error submitting responses"
         )
-        technical_score = (
-            sum(r.score for r in technical_responses) / len(technical_responses)
-            if technical_responses else overall_score
+
+@router.get("/response/{response_id}", response_model=ResponseStatusResponse)
+async def get_response_status(
+    response_id: int,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db)
+):
+    """Analysis status and result of a submitted response"""
+    user_id = await get_current_user_id(credentials)
+    
+    result = await db.execute(
+        select(InterviewResponse)
+        .join(Interview, InterviewResponse.interview_id == Interview.id)
+        .where((InterviewResponse.id == response_id) & (Interview.user_id == user_id))
+    )
+    response = result.scalar_one_or_none()
+    
+    if not response:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Response not found"
         )
+    
+    return ResponseStatusResponse(
+        id=response.id,
+        interview_id=response.interview_id,
+        question_id=response.question_id,
+        status=response.status,
+        score=response.score,
+        feedback=response.feedback
+    )
+
+@router.post("/complete/{interview_id}")
+async def complete_interview(
+    interview_id: int,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db)
+):
+    """Complete interview and generate report"""
+    try:
+        user_id = await get_active_user_id(credentials, db)
         
-        # Calculate total duration
-        total_duration = sum(r.duration for r in responses)
+        # Get interview
+        result = await db.execute(
+            select(Interview.job_description, Interview.difficulty).where(
+                (Interview.id == interview_id) & (Interview.user_id == user_id)
+            )
+        )
+        interview = result.first()
         
-        # Update interview
-        interview.overall_score = overall_score
-        interview.communication_score = communication_score
-        interview.technical_score = technical_score
-        interview.duration = total_duration
-        interview.status = "completed"
-        interview.updated_at = datetime.utcnow()
+        if not interview:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Interview not found"
+            )
         
+        # Release the connection before the LLM runs; the analysis uses its own sessions
         await db.commit()
         
+        totals = await complete_interview_analysis(
+            interview_id, interview.job_description, interview.difficulty
+        )
+        
+        if not totals:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No responses submitted"
+            )
+        
+        overall_score = totals["overall_score"]
+        communication_score = totals["communication_score"]
+        technical_score = totals["technical_score"]
+        total_duration = totals["duration"]
+        
         logger.info(f"Interview {interview_id} completed with score {overall_score:.2f}")
         
         return {
@@ -338,64 +542,46 @@ async def complete_interview(
 @router.get("/report/{interview_id}", response_model=InterviewReportResponse)
 async def get_interview_report(
     interview_id: int,
+    request: Request,
+    response: Response,
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get interview report"""
+    """
+    Get interview report
+
+    Reports are materialized at completion, so this is a single row read.
+    The ETag is a hash of the stored document; a matching If-None-Match
+    returns 304 without a body.
+    """
     try:
         user_id = await get_current_user_id(credentials)
         
-        # Get interview
         result = await db.execute(
-            select(Interview).where(
+            select(Interview.report).where(
                 (Interview.id == interview_id) & (Interview.user_id == user_id)
             )
         )
-        interview = result.scalar_one_or_none()
+        row = result.first()
         
-        if not interview:
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Interview not found"
             )
         
-        # Get responses for feedback
-        result = await db.execute(
-            select(InterviewResponse).where(InterviewResponse.interview_id == interview_id)
-        )
-        responses = result.scalars().all()
-        
-        # Generate strengths and improvements
-        strengths = []
-        improvements = []
-        
-        if interview.overall_score >= 80:
-            strengths.append("Excellent overall performance")
-        if interview.communication_score >= 75:
-            strengths.append("Strong communication skills")
-        if interview.technical_score >= 75:
-            strengths.append("Solid technical knowledge")
-        
-        if interview.overall_score < 70:
-            improvements.append("Focus on providing more detailed answers")
-        if interview.communication_score < 70:
-            improvements.append("Work on articulating your thoughts more clearly")
-        if interview.technical_score < 70:
-            improvements.append("Deepen your technical knowledge in key areas")
-        
-        if not strengths:
-            strengths.append("Good effort on the interview")
-        if not improvements:
-            improvements.append("Continue practicing to maintain performance")
-        
-        return InterviewReportResponse(
-            overall_score=round(interview.overall_score, 2),
-            communication_score=round(interview.communication_score, 2),
-            technical_score=round(interview.technical_score, 2),
-            duration=interview.duration,
-            strengths=strengths,
-            improvements=improvements
-        )
+        report_json = row.report
+        if report_json is None:
+            # Completed before reports were stored; build without persisting
+            report_json = serialize_report(await load_interview_report(db, interview_id))
+        
+        etag = f'"{hashlib.sha256(report_json.encode()).hexdigest()[:32]}"'
+        if etag in [tag.strip() for tag in request.headers.get("if-none-match", "").split(",")]:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "private, no-cache"
+        return InterviewReportResponse(**json.loads(report_json))
     except HTTPException:
         raise
     except Exception as e:
@@ -407,17 +593,40 @@ async def get_interview_report(
 
 @router.get("/list")
 async def list_interviews(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get all interviews for current user"""
+    """
+    Get the current user's interviews, newest first
+
+    Paginated by keyset; pass the X-Next-Cursor header of a page as cursor
+    to fetch the next one. The header is absent on the last page.
+    """
     try:
         user_id = await get_current_user_id(credentials)
         
-        result = await db.execute(
-            select(Interview).where(Interview.user_id == user_id).order_by(Interview.created_at.desc())
+        query = keyset_page(
+            select(
+                Interview.id,
+                Interview.job_title,
+                Interview.difficulty,
+                Interview.overall_score,
+                Interview.status,
+                Interview.created_at
+            ).where(Interview.user_id == user_id),
+            Interview.created_at,
+            Interview.id,
+            cursor,
+            limit
         )
-        interviews = result.scalars().all()
+        result = await db.execute(query)
+        interviews, next_cursor = split_page(result.all(), limit)
+        
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
         
         return [
             {
@@ -430,9 +639,256 @@ async def list_interviews(
             }
             for i in interviews
         ]
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Error listing interviews: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error retrieving interviews"
         )
+
+@router.websocket("/transcribe/{interview_id}")
+async def stream_transcription(websocket: WebSocket, interview_id: int, token: str, question_id: Optional[int] = None):
+    """
+    Stream an answer recording and receive incremental transcripts
+
+    The client sends 16 kHz mono PCM16 little-endian audio as binary
+    messages and {"type": "end"} when the answer is finished. The server
+    replies with "partial" messages as speech segments are transcribed and a
+    "final" message with the full transcript.
+    """
+    payload = get_token_claims(token)
+    if not payload:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    user_id = int(payload.get("sub"))
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(Interview.id).where(
+                (Interview.id == interview_id) & (Interview.user_id == user_id)
+            )
+        )
+        if result.scalar_one_or_none() is None:
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+            return
+
+    await websocket.accept()
+    await websocket.send_json({"type": "ready", "sample_rate": SAMPLE_RATE, "encoding": "pcm_s16le"})
+
+    session = StreamingTranscription(transcription_engine, websocket.send_json)
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                session.cancel()
+                return
+            if message.get("bytes"):
+                await session.add_chunk(message["bytes"])
+            elif message.get("text") and json.loads(message["text"]).get("type") == "end":
+                break
+
+        transcript = await session.finish()
+
+        os.makedirs(settings.RECORDINGS_DIR, exist_ok=True)
+        filename = f"{user_id}_{interview_id}_{question_id or 0}_{datetime.utcnow().timestamp()}.wav"
+        await asyncio.to_thread(session.save_recording, os.path.join(settings.RECORDINGS_DIR, filename))
+
+        await websocket.send_json({"type": "final", "transcript": transcript, "recording": filename})
+        await websocket.close()
+        logger.info(f"Streaming transcription completed for interview {interview_id}")
+    except WebSocketDisconnect:
+        session.cancel()
+    except RecordingTooLong as e:
+        session.cancel()
+        await websocket.send_json({"type": "error", "detail": str(e)})
+        await websocket.close(code=status.WS_1009_MESSAGE_TOO_BIG)
+    except Exception as e:
+        logger.error(f"Streaming transcription error: {str(e)}")
+        session.cancel()
+        await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+
+@router.websocket("/live-score/{interview_id}/{question_id}")
+async def live_score(websocket: WebSocket, interview_id: int, question_id: int, token: str):
+    """
+    Score an answer while it is being typed
+
+    The client sends edits as {"offset": int, "delete": int, "insert": str}
+    (or {"text": str} to replace the whole answer) and receives a "hint"
+    message with the provisional score after each one. Features are kept
+    incrementally, so each update costs time proportional to the edit.
+    """
+    payload = get_token_claims(token)
+    if not payload:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    user_id = int(payload.get("sub"))
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(InterviewQuestion.category, Interview.difficulty)
+            .join(Interview, Interview.id == InterviewQuestion.interview_id)
+            .where(
+                (InterviewQuestion.id == question_id) &
+                (InterviewQuestion.interview_id == interview_id) &
+                (Interview.user_id == user_id)
+            )
+        )
+        row = result.first()
+        if row is None:
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+            return
+
+    await websocket.accept()
+    state = IncrementalAnswerState(row.category, row.difficulty)
+    try:
+        while True:
+            message = await websocket.receive_json()
+            try:
+                if "text" in message:
+                    state.reset(str(message["text"]))
+                else:
+                    state.apply_edit(
+                        int(message.get("offset", 0)),
+                        int(message.get("delete", 0)),
+                        str(message.get("insert", ""))
+                    )
+            except (TypeError, ValueError) as e:
+                # The client is out of sync; it should resend the full text
+                await websocket.send_json({"type": "error", "detail": str(e)})
+                continue
+
+            analysis = state.score()
+            await websocket.send_json({
+                "type": "hint",
+                "score": analysis["score"],
+                "word_count": analysis["word_count"],
+                "quality_metrics": analysis["quality_metrics"],
+                "feedback": analysis["feedback"]
+            })
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.error(f"Live scoring error: {str(e)}")
+        await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+
+@router.websocket("/responses/{interview_id}/events")
+async def response_events(websocket: WebSocket, interview_id: int, token: str):
+    """
+    Push analysis results for an interview's responses
+
+    Sends a "snapshot" of every response's status on connect, then an
+    "analyzed" message whenever the worker finishes one.
+    """
+    payload = get_token_claims(token)
+    if not payload:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    user_id = int(payload.get("sub"))
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(Interview.id).where(
+                (Interview.id == interview_id) & (Interview.user_id == user_id)
+            )
+        )
+        if result.scalar_one_or_none() is None:
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+            return
+
+    await websocket.accept()
+
+    events = None
+    receiver = None
+    try:
+        # Subscribe before the snapshot so no result falls between the two
+        events = await notifier.subscribe(RESPONSE_ANALYZED)
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(
+                    InterviewResponse.id,
+                    InterviewResponse.status,
+                    InterviewResponse.score,
+                    InterviewResponse.feedback
+                ).where(InterviewResponse.interview_id == interview_id)
+            )
+            await websocket.send_json({
+                "type": "snapshot",
+                "responses": [
+                    {"id": r.id, "status": r.status, "score": r.score, "feedback": r.feedback}
+                    for r in result.all()
+                ]
+            })
+
+        receiver = asyncio.create_task(websocket.receive())
+        while True:
+            getter = asyncio.create_task(events.get())
+            done, _ = await asyncio.wait({getter, receiver}, return_when=asyncio.FIRST_COMPLETED)
+            if receiver in done:
+                getter.cancel()
+                if receiver.result()["type"] == "websocket.disconnect":
+                    return
+                # Client messages are ignored; keep listening for disconnect
+                receiver = asyncio.create_task(websocket.receive())
+                continue
+
+            event = getter.result()
+            if event.get("interview_id") == interview_id:
+                await websocket.send_json({"type": "analyzed", **event})
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.error(f"Response events error: {str(e)}")
+        await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+    finally:
+        if receiver is not None:
+            receiver.cancel()
+        if events is not None:
+            notifier.unsubscribe(RESPONSE_ANALYZED, events)
+
+@router.websocket("/session/{interview_id}")
+async def interview_session(websocket: WebSocket, interview_id: int, token: str):
+    """
+    Run an interview over one authenticated connection
+
+    On connect the server sends the "questions". The client then sends
+    {"type": "answer", "question_id", "answer", "duration"} per question,
+    {"type": "complete"} and {"type": "report"}. Answers are acknowledged
+    with a provisional score ("answer_received"), confirmed when stored
+    ("saved"), and updated with the LLM result ("analyzed"); completion
+    replies with the full report ("completed").
+    """
+    payload = get_token_claims(token)
+    if not payload:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    session = InterviewSession(int(payload.get("sub")), websocket.send_json)
+    try:
+        if not await session.open(interview_id):
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+            return
+
+        while True:
+            try:
+                message = json.loads(await websocket.receive_text())
+            except ValueError:
+                message = None
+            if not isinstance(message, dict):
+                await session.send({"type": "error", "detail": "Messages must be JSON objects"})
+                continue
+            await session.handle(message)
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.error(f"Interview session error: {str(e)}")
+        await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+    finally:
+        await session.close()
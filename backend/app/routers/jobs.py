@@ -0,0 +1,57 @@
+from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from pydantic import BaseModel
+from typing import Any, Optional
+from datetime import datetime
+import logging
+import json
+
+from app.database import get_db
+from app.models.job import Job
+from app.utils.auth import security, get_current_user_id
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+class JobStatusResponse(BaseModel):
+    id: int
+    job_type: str
+    status: str
+    attempts: int
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+@router.get("/{job_id}", response_model=JobStatusResponse)
+async def get_job(
+    job_id: int,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db)
+):
+    """Status and result of a background job"""
+    user_id = await get_current_user_id(credentials)
+    
+    result = await db.execute(
+        select(Job).where((Job.id == job_id) & (Job.user_id == user_id))
+    )
+    job = result.scalar_one_or_none()
+    
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    
+    return JobStatusResponse(
+        id=job.id,
+        job_type=job.job_type,
+        status=job.status,
+        attempts=job.attempts,
+        result=json.loads(job.result) if job.result else None,
+        error=job.last_error if job.status == "failed" else None,
+        created_at=job.created_at,
+        finished_at=job.finished_at
+    )
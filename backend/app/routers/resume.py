@@ -1,5 +1,5 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, status, Depends
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi import APIRouter, UploadFile, File, HTTPException, status, Depends, Query, Response
+from fastapi.security import HTTPAuthorizationCredentials
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -13,13 +13,15 @@ from datetime import datetime
 from app.database import get_db
 from app.models.resume import Resume
 from app.models.user import User
-from app.utils.security import decode_token
-from app.services.resume_parser import parse_pdf, parse_docx, extract_resume_data
+from app.utils.auth import security, get_active_user_id, get_current_user_id
+from app.utils.executors import ExecutorSaturated
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, keyset_page, split_page
+from app.services.resume_parser import parse_pdf, parse_docx, extract_resume_data, parse_executor
+from app.services.job_queue import enqueue
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
-security = HTTPBearer()
 
 class ResumeData(BaseModel):
     full_name: str
@@ -47,30 +49,22 @@ class ATSScoreResponse(BaseModel):
     keyword_matches: int
     total_keywords: int
 
-async def get_current_user_id(credentials: HTTPAuthorizationCredentials
- = Depends(security)) -> int:
-    """Extract user ID from JWT token"""
-    token = credentials.credentials
-    payload = decode_token(token)
-    
-    if not payload:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token"
-        )
-    
-    return int(payload.get("sub"))
-
 @router.post("/upload")
 async def upload_resume(
     file: UploadFile = File(...),
+    defer: bool = False,
     credentials: HTTPAuthorizationCredentials
  = Depends(security),
     db: AsyncSession = Depends(get_db)
 ):
-    """Upload and parse resume file"""
+    """
+    Upload and parse resume file
+
+    With defer=true the file is parsed by a background parse_resume job;
+    the response carries the job id to poll at /api/jobs/{job_id}.
+    """
     try:
-        user_id = await get_current_user_id(credentials)
+        user_id = await get_active_user_id(credentials, db)
         
         # Validate file type
         allowed_extensions = {".pdf", ".docx", ".doc"}
@@ -91,11 +85,27 @@ async def upload_resume(
             content = await file.read()
             f.write(content)
         
-        # Parse resume based on file type
-        if file_ext == ".pdf":
-            parse_result = parse_pdf(file_path)
-        else:
-            parse_result = parse_docx(file_path)
+        if defer:
+            job = await enqueue(
+                db,
+                "parse_resume",
+                {"user_id": user_id, "file_path": file_path, "title": file.filename.replace(file_ext, "")},
+                user_id=user_id
+            )
+            await db.commit()
+            return {"job_id": job.id, "status": job.status, "message": "Resume uploaded, parsing queued"}
+        
+        # Parse resume based on file type, off the event loop
+        try:
+            parse_result = await parse_executor.run(
+                "parse", parse_pdf if file_ext == ".pdf" else parse_docx, file_path
+            )
+        except ExecutorSaturated as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Resume parsing is busy, please retry shortly or upload with defer=true",
+                headers={"Retry-After": str(e.retry_after)}
+            )
         
         if "error" in parse_result:
             raise HTTPException(
@@ -145,18 +155,41 @@ async def upload_resume(
 
 @router.get("/list")
 async def list_resumes(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     credentials: HTTPAuthorizationCredentials
  = Depends(security),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get all resumes for current user"""
+    """
+    Get the current user's resumes, newest first
+
+    Paginated by keyset; pass the X-Next-Cursor header of a page as cursor
+    to fetch the next one. The header is absent on the last page.
+    """
     try:
         user_id = await get_current_user_id(credentials)
         
-        result = await db.execute(
-            select(Resume).where(Resume.user_id == user_id).order_by(Resume.created_at.desc())
+        query = keyset_page(
+            select(
+                Resume.id,
+                Resume.title,
+                Resume.full_name,
+                Resume.email,
+                Resume.ats_score,
+                Resume.created_at
+            ).where(Resume.user_id == user_id),
+            Resume.created_at,
+            Resume.id,
+            cursor,
+            limit
         )
-        resumes = result.scalars().all()
+        result = await db.execute(query)
+        resumes, next_cursor = split_page(result.all(), limit)
+        
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
         
         return [
             {
@@ -169,6 +202,13 @@ async def list_resumes(
             }
             for r in resumes
         ]
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Error listing resumes: {str(e)}")
         raise HTTPException(
@@ -230,7 +270,7 @@ async def analyze_ats(
 ):
     """Analyze resume for ATS compatibility"""
     try:
-        user_id = await get_current_user_id(credentials)
+        user_id = await get_active_user_id(credentials, db)
         
         result = await db.execute(
             select(Resume).where((Resume.id == resume_id) & (Resume.user_id == user_id))
@@ -305,7 +345,7 @@ async def delete_resume(
 ):
     """Delete a resume"""
     try:
-        user_id = await get_current_user_id(credentials)
+        user_id = await get_active_user_id(credentials, db)
         
         result = await db.execute(
             select(Resume).where((Resume.id == resume_id) & (Resume.user_id == user_id))
@@ -337,6 +377,34 @@ async def delete_resume(
             detail="Error deleting resume"
         )
 
+@router.post("/render/{resume_id}", status_code=status.HTTP_202_ACCEPTED)
+async def render_resume(
+    resume_id: int,
+    template_id: Optional[int] = None,
+    credentials: HTTPAuthorizationCredentials
+ = Depends(security),
+    db: AsyncSession = Depends(get_db)
+):
+    """Queue rendering of a resume; poll /api/jobs/{job_id} for the file"""
+    user_id = await get_active_user_id(credentials, db)
+    
+    result = await db.execute(
+        select(Resume.id).where((Resume.id == resume_id) & (Resume.user_id == user_id))
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Resume not found"
+        )
+    
+    payload = {"resume_id": resume_id}
+    if template_id is not None:
+        payload["template_id"] = template_id
+    job = await enqueue(db, "render_pdf", payload, user_id=user_id)
+    await db.commit()
+    
+    return {"job_id": job.id, "status": job.status}
+
 @router.get("/templates")
 async def get_templates():
     """Get available resume templates"""
@@ -0,0 +1,103 @@
+import hashlib
+import logging
+import os
+import subprocess
+import uuid
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from app.config import settings
+from app.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+
+# (path, mtime, size) -> content hash, so unchanged files are not re-hashed
+_hash_cache = TTLCache(max_entries=4096, ttl_seconds=24 * 3600)
+
+def content_hash(audio_file_path: str) -> str:
+    """
+    SHA-256 of the recording's bytes
+    """
+    stat = os.stat(audio_file_path)
+    key = (os.path.abspath(audio_file_path), stat.st_mtime_ns, stat.st_size)
+    digest = _hash_cache.get(key)
+    if digest is None:
+        hasher = hashlib.sha256()
+        with open(audio_file_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                hasher.update(block)
+        digest = hasher.hexdigest()
+        _hash_cache.set(key, digest)
+    return digest
+
+def _decode(audio_file_path: str, output_path: Path) -> None:
+    """Decode and resample to 16 kHz mono float32 with ffmpeg"""
+    tmp_path = output_path.with_name(f"{output_path.name}.{uuid.uuid4().hex}.tmp")
+    cmd = [
+        "ffmpeg", "-nostdin", "-threads", "0", "-i", audio_file_path,
+        "-f", "f32le", "-ac", "1", "-acodec", "pcm_f32le", "-ar", str(SAMPLE_RATE),
+        "-y", str(tmp_path)
+    ]
+    try:
+        subprocess.run(cmd, capture_output=True, check=True)
+        os.replace(tmp_path, output_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+def prune_cache(cache_dir: Path, max_bytes: int, keep: Optional[Path] = None) -> int:
+    """
+    Delete least recently used decoded recordings until the cache fits max_bytes
+
+    Cache hits touch their file, so mtime orders entries by last use.
+    Returns the number of files removed.
+    """
+    entries = []
+    total = 0
+    for path in cache_dir.glob("*.f32"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+        total += stat.st_size
+
+    removed = 0
+    for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        # Open memory maps keep the data readable after the unlink
+        path.unlink(missing_ok=True)
+        total -= size
+        removed += 1
+    return removed
+
+def load_audio(audio_file_path: str) -> np.ndarray:
+    """
+    Return the recording as 16 kHz mono float32 samples
+
+    Each recording is decoded once; later calls memory-map the cached
+    samples instead of running ffmpeg again. The cache is kept under
+    AUDIO_CACHE_MAX_BYTES by evicting the least recently used recordings.
+    """
+    digest = content_hash(audio_file_path)
+    cache_path = Path(settings.AUDIO_CACHE_DIR) / f"{digest}.f32"
+
+    if not cache_path.exists():
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        _decode(audio_file_path, cache_path)
+        logger.info(f"Decoded audio {audio_file_path} to {cache_path}")
+        removed = prune_cache(cache_path.parent, settings.AUDIO_CACHE_MAX_BYTES, keep=cache_path)
+        if removed:
+            logger.info(f"Evicted {removed} decoded recordings from {cache_path.parent}")
+    else:
+        os.utime(cache_path)
+
+    if cache_path.stat().st_size == 0:
+        return np.zeros(0, dtype=np.float32)
+    return np.memmap(cache_path, dtype=np.float32, mode="r")
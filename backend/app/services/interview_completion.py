@@ -0,0 +1,350 @@
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func, select, true, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import AsyncSessionLocal
+from app.models.interview import Interview, InterviewQuestion, InterviewResponse
+from app.services.llm_service import forget_session_context
+from app.services.speech_analyzer import analyze_interview_batch
+
+logger = logging.getLogger(__name__)
+
+# Question categories behind the communication and technical sub-scores
+COMMUNICATION_CATEGORY = "behavioral"
+TECHNICAL_CATEGORY = "technical"
+
+# Bump when the report layout or rules change, then run app.commands.rebuild_reports
+REPORT_VERSION = 1
+
+async def finalize_interview_scores(db: AsyncSession, interview_id: int) -> Dict[str, Any]:
+    """
+    Aggregate response scores and mark the interview completed
+
+    One statement groups the responses by question category, derives the
+    overall, communication and technical scores and total duration, and
+    updates the interview row through a data-modifying CTE, so the cost
+    does not grow with the number of responses. Category scores fall back
+    to the overall score when the interview has no question of that kind.
+
+    Returns the interview totals and per-category averages; empty when the
+    interview has no responses.
+    """
+    per_category = (
+        select(
+            InterviewQuestion.category.label("category"),
+            func.sum(InterviewResponse.score).label("total_score"),
+            func.count().label("responses"),
+            func.sum(InterviewResponse.duration).label("duration")
+        )
+        .join(InterviewQuestion, InterviewResponse.question_id == InterviewQuestion.id)
+        .where(InterviewResponse.interview_id == interview_id)
+        .group_by(InterviewQuestion.category)
+        .cte("per_category")
+    )
+
+    overall = func.sum(per_category.c.total_score) / func.sum(per_category.c.responses)
+
+    def category_average(category: str):
+        matches = per_category.c.category == category
+        return func.coalesce(
+            func.sum(per_category.c.total_score).filter(matches)
+            / func.sum(per_category.c.responses).filter(matches),
+            overall
+        )
+
+    totals = select(
+        overall.label("overall_score"),
+        category_average(COMMUNICATION_CATEGORY).label("communication_score"),
+        category_average(TECHNICAL_CATEGORY).label("technical_score"),
+        func.sum(per_category.c.duration).label("duration")
+    ).cte("totals")
+
+    completed = (
+        update(Interview)
+        .where((Interview.id == interview_id) & totals.c.overall_score.isnot(None))
+        .values(
+            overall_score=totals.c.overall_score,
+            communication_score=totals.c.communication_score,
+            technical_score=totals.c.technical_score,
+            duration=totals.c.duration,
+            status="completed",
+            updated_at=datetime.utcnow()
+        )
+        .returning(Interview.id)
+        .cte("completed")
+    )
+
+    result = await db.execute(
+        select(
+            per_category.c.category,
+            (per_category.c.total_score / per_category.c.responses).label("average_score"),
+            per_category.c.responses,
+            totals.c.overall_score,
+            totals.c.communication_score,
+            totals.c.technical_score,
+            totals.c.duration
+        )
+        .select_from(per_category)
+        .join(totals, true())
+        .add_cte(completed)
+        .order_by(per_category.c.category)
+    )
+    rows = result.all()
+    if not rows:
+        return {}
+
+    first = rows[0]
+    return {
+        "overall_score": float(first.overall_score),
+        "communication_score": float(first.communication_score),
+        "technical_score": float(first.technical_score),
+        "duration": int(first.duration or 0),
+        "categories": {
+            row.category: {"score": float(row.average_score), "responses": row.responses}
+            for row in rows
+        }
+    }
+
+async def complete_interview_analysis(
+    interview_id: int,
+    job_description: str,
+    difficulty: str
+) -> Dict[str, Any]:
+    """
+    Score all answers, complete the interview and store its report
+
+    Runs the batch LLM analysis, writes the scores with one bulk UPDATE,
+    aggregates them with finalize_interview_scores and materializes the
+    report. Returns the totals, or an empty dict when no responses were
+    submitted.
+
+    No connection is held while the LLM runs: the answers are read in one
+    short session and the results written and committed in another. The
+    write transaction locks the interview row and re-checks its status, so
+    when a concurrent completion finished first its stored result is
+    returned instead of being overwritten.
+
+    The scores written here are final. Queued analyze_response jobs only
+    update responses that are still pending, so one finishing late cannot
+    overwrite them or make the totals and report stale.
+    """
+    # Answers and questions for the LLM, in one query
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(
+                InterviewResponse.id,
+                InterviewResponse.answer,
+                InterviewResponse.feedback,
+                InterviewResponse.duration,
+                InterviewQuestion.question_number,
+                InterviewQuestion.question,
+                InterviewQuestion.category
+            )
+            .join(InterviewQuestion, InterviewResponse.question_id == InterviewQuestion.id)
+            .where(InterviewResponse.interview_id == interview_id)
+            .order_by(InterviewQuestion.question_number)
+        )
+        rows = result.all()
+    if not rows:
+        return {}
+
+    # Evaluate all answers together with the LLM
+    analyses = await analyze_interview_batch(
+        job_description=job_description,
+        items=[
+            {
+                "question": row.question,
+                "answer": row.answer,
+                "category": row.category,
+                "difficulty": difficulty
+            }
+            for row in rows
+        ],
+        interview_id=interview_id
+    )
+    forget_session_context(interview_id)
+
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(Interview.status, Interview.report)
+            .where(Interview.id == interview_id)
+            .with_for_update()
+        )
+        interview = result.first()
+        if interview is None:
+            return {}
+        if interview.status == "completed":
+            report = json.loads(interview.report) if interview.report else await load_interview_report(db, interview_id)
+            return _totals_from_report(report)
+
+        # Store the scores with one bulk UPDATE
+        await db.execute(
+            update(InterviewResponse),
+            [
+                {
+                    "id": row.id,
+                    "score": analysis["score"],
+                    "feedback": analysis["feedback"] or row.feedback,
+                    "score_source": analysis.get("source", "heuristic"),
+                    "status": "analyzed"
+                }
+                for row, analysis in zip(rows, analyses)
+            ]
+        )
+
+        # Aggregate by category and update the interview in one statement
+        totals = await finalize_interview_scores(db, interview_id)
+
+        # Materialize the report so viewing it is a single row read
+        report = build_report(totals, [
+            {
+                "question_number": row.question_number,
+                "question": row.question,
+                "category": row.category,
+                "score": analysis["score"],
+                "feedback": analysis["feedback"] or row.feedback,
+                "duration": row.duration
+            }
+            for row, analysis in zip(rows, analyses)
+        ])
+        await db.execute(
+            update(Interview)
+            .where(Interview.id == interview_id)
+            .values(report=serialize_report(report))
+        )
+        await db.commit()
+
+    totals["report"] = report
+    return totals
+
+def _totals_from_report(report: Dict[str, Any]) -> Dict[str, Any]:
+    """Totals in complete_interview_analysis's shape from a stored report"""
+    totals = {
+        key: report[key]
+        for key in ("overall_score", "communication_score", "technical_score", "duration", "categories")
+    }
+    totals["report"] = report
+    return totals
+
+def report_highlights(overall_score: float, communication_score: float, technical_score: float):
+    """Strengths and improvements derived from the interview scores"""
+    strengths = []
+    improvements = []
+    
+    if overall_score >= 80:
+        strengths.append("Excellent overall performance")
+    if communication_score >= 75:
+        strengths.append("Strong communication skills")
+    if technical_score >= 75:
+        strengths.append("Solid technical knowledge")
+    
+    if overall_score < 70:
+        improvements.append("Focus on providing more detailed answers")
+    if communication_score < 70:
+        improvements.append("Work on articulating your thoughts more clearly")
+    if technical_score < 70:
+        improvements.append("Deepen your technical knowledge in key areas")
+    
+    if not strengths:
+        strengths.append("Good effort on the interview")
+    if not improvements:
+        improvements.append("Continue practicing to maintain performance")
+    
+    return strengths, improvements
+
+def build_report(totals: Dict[str, Any], questions: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Assemble the interview report document
+
+    totals holds overall_score, communication_score, technical_score,
+    duration and optionally categories ({category: {score, responses}});
+    questions holds question_number, question, category, score, feedback and
+    duration for each response.
+    """
+    strengths, improvements = report_highlights(
+        totals["overall_score"], totals["communication_score"], totals["technical_score"]
+    )
+    return {
+        "version": REPORT_VERSION,
+        "overall_score": round(totals["overall_score"], 2),
+        "communication_score": round(totals["communication_score"], 2),
+        "technical_score": round(totals["technical_score"], 2),
+        "duration": totals["duration"],
+        "strengths": strengths,
+        "improvements": improvements,
+        "categories": {
+            category: {"score": round(values["score"], 2), "responses": values["responses"]}
+            for category, values in totals.get("categories", {}).items()
+        },
+        "questions": [
+            {
+                "question_number": q["question_number"],
+                "question": q["question"],
+                "category": q["category"],
+                "score": round(q["score"] or 0.0, 2),
+                "feedback": q["feedback"],
+                "duration": q["duration"]
+            }
+            for q in questions
+        ]
+    }
+
+def serialize_report(report: Dict[str, Any]) -> str:
+    """Compact, stable JSON so identical reports store identical bytes"""
+    return json.dumps(report, separators=(",", ":"), sort_keys=True)
+
+async def load_interview_report(db: AsyncSession, interview_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Build the report from the stored scores without writing anything
+
+    Used for interviews completed before reports were materialized and by
+    the rebuild command.
+    """
+    result = await db.execute(
+        select(
+            Interview.overall_score,
+            Interview.communication_score,
+            Interview.technical_score,
+            Interview.duration
+        ).where(Interview.id == interview_id)
+    )
+    interview = result.first()
+    if interview is None:
+        return None
+
+    result = await db.execute(
+        select(
+            InterviewQuestion.question_number,
+            InterviewQuestion.question,
+            InterviewQuestion.category,
+            InterviewResponse.score,
+            InterviewResponse.feedback,
+            InterviewResponse.duration
+        )
+        .join(InterviewQuestion, InterviewResponse.question_id == InterviewQuestion.id)
+        .where(InterviewResponse.interview_id == interview_id)
+        .order_by(InterviewQuestion.question_number, InterviewResponse.id)
+    )
+    questions = [dict(row._mapping) for row in result.all()]
+
+    categories: Dict[str, Dict[str, Any]] = {}
+    for q in questions:
+        entry = categories.setdefault(q["category"], {"total": 0.0, "responses": 0})
+        entry["total"] += q["score"] or 0.0
+        entry["responses"] += 1
+
+    totals = {
+        "overall_score": interview.overall_score or 0.0,
+        "communication_score": interview.communication_score or 0.0,
+        "technical_score": interview.technical_score or 0.0,
+        "duration": interview.duration or 0,
+        "categories": {
+            category: {"score": entry["total"] / entry["responses"], "responses": entry["responses"]}
+            for category, entry in sorted(categories.items())
+        }
+    }
+    return build_report(totals, questions)
@@ -0,0 +1,223 @@
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import select
+
+from app.database import AsyncSessionLocal
+from app.models.interview import Interview, InterviewQuestion, InterviewResponse
+from app.services.interview_completion import (
+    complete_interview_analysis,
+    load_interview_report
+)
+from app.services.job_queue import enqueue
+from app.services.notifier import RESPONSE_ANALYZED, notifier
+from app.services.response_analyzer import analyze_response
+
+logger = logging.getLogger(__name__)
+
+class InterviewSession:
+    """
+    In-memory state of one interview over a WebSocket
+
+    The interview and its questions are loaded once when the session opens,
+    so later steps need no ownership or question lookups. Answers are scored
+    provisionally on receipt and written through to the database by a
+    single background writer, in order, with their analysis jobs.
+    """
+
+    def __init__(self, user_id: int, send: Callable[[Dict[str, Any]], Awaitable[None]]):
+        self.user_id = user_id
+        self.interview_id: Optional[int] = None
+        self.job_description = ""
+        self.difficulty = "medium"
+        self.status = "in_progress"
+        self.report: Optional[Dict[str, Any]] = None
+        self.questions: Dict[int, Dict[str, Any]] = {}
+        self._send = send
+        self._send_lock = asyncio.Lock()
+        self._writes: asyncio.Queue = asyncio.Queue()
+        self._tasks: List[asyncio.Task] = []
+        self._events: Optional[asyncio.Queue] = None
+
+    async def open(self, interview_id: int) -> bool:
+        """Load the interview and its questions; False if not owned by the user"""
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(
+                    Interview.job_description,
+                    Interview.difficulty,
+                    Interview.status,
+                    Interview.report
+                ).where((Interview.id == interview_id) & (Interview.user_id == self.user_id))
+            )
+            interview = result.first()
+            if interview is None:
+                return False
+
+            result = await db.execute(
+                select(
+                    InterviewQuestion.id,
+                    InterviewQuestion.question_number,
+                    InterviewQuestion.question,
+                    InterviewQuestion.category
+                )
+                .where(InterviewQuestion.interview_id == interview_id)
+                .order_by(InterviewQuestion.question_number)
+            )
+            questions = result.all()
+
+        self.interview_id = interview_id
+        self.job_description = interview.job_description
+        self.difficulty = interview.difficulty or "medium"
+        self.status = interview.status
+        self.report = json.loads(interview.report) if interview.report else None
+        self.questions = {q.id: dict(q._mapping) for q in questions}
+
+        self._tasks.append(asyncio.create_task(self._write_answers()))
+        try:
+            self._events = await notifier.subscribe(RESPONSE_ANALYZED)
+            self._tasks.append(asyncio.create_task(self._forward_results()))
+        except Exception as e:
+            logger.warning(f"Analysis results will not be pushed for interview {interview_id}: {e}")
+
+        await self.send({
+            "type": "questions",
+            "interview_id": interview_id,
+            "status": self.status,
+            "questions": list(self.questions.values())
+        })
+        return True
+
+    async def send(self, message: Dict[str, Any]) -> None:
+        async with self._send_lock:
+            await self._send(message)
+
+    async def handle(self, message: Dict[str, Any]) -> None:
+        """Dispatch one client message"""
+        kind = message.get("type")
+        if kind == "answer":
+            await self.submit_answer(message)
+        elif kind == "complete":
+            await self.complete()
+        elif kind == "report":
+            await self.send_report()
+        else:
+            await self.send({"type": "error", "detail": f"Unknown message type: {kind}"})
+
+    async def submit_answer(self, message: Dict[str, Any]) -> None:
+        question = self.questions.get(message.get("question_id"))
+        if question is None:
+            await self.send({"type": "error", "detail": "Question not found"})
+            return
+        if self.status == "completed":
+            await self.send({"type": "error", "detail": "Interview already completed"})
+            return
+
+        # Validate everything before acknowledging, so an ack always means queued
+        answer = message.get("answer", "")
+        try:
+            duration = int(message.get("duration", 0))
+        except (TypeError, ValueError):
+            duration = -1
+        if not isinstance(answer, str) or duration < 0:
+            await self.send({
+                "type": "error",
+                "detail": "answer must be a string and duration a non-negative integer",
+                "question_id": question["id"]
+            })
+            return
+
+        analysis = analyze_response(
+            question=question["question"],
+            answer=answer,
+            category=question["category"],
+            difficulty=self.difficulty
+        )
+        await self.send({
+            "type": "answer_received",
+            "question_id": question["id"],
+            "status": "pending",
+            "score": analysis["score"],
+            "feedback": analysis["feedback"],
+            "quality_metrics": analysis["quality_metrics"]
+        })
+
+        self._writes.put_nowait({
+            "question_id": question["id"],
+            "answer": answer,
+            "duration": duration,
+            "score": analysis["score"],
+            "feedback": analysis["feedback"]
+        })
+
+    async def complete(self) -> None:
+        # Completion must see every answer received so far
+        await self._writes.join()
+
+        totals = await complete_interview_analysis(
+            self.interview_id, self.job_description, self.difficulty
+        )
+        if not totals:
+            await self.send({"type": "error", "detail": "No responses submitted"})
+            return
+
+        self.status = "completed"
+        self.report = totals["report"]
+        logger.info(f"Interview {self.interview_id} completed over session with score {totals['overall_score']:.2f}")
+        await self.send({"type": "completed", "interview_id": self.interview_id, "report": self.report})
+
+    async def send_report(self) -> None:
+        if self.report is None:
+            async with AsyncSessionLocal() as db:
+                self.report = await load_interview_report(db, self.interview_id)
+        await self.send({"type": "report", "interview_id": self.interview_id, "report": self.report})
+
+    async def close(self) -> None:
+        """Finish pending writes, then stop background tasks"""
+        if self._tasks:
+            try:
+                await asyncio.wait_for(self._writes.join(), timeout=10)
+            except asyncio.TimeoutError:
+                logger.error(f"Dropped {self._writes.qsize()} unsaved answers for interview {self.interview_id}")
+        for task in self._tasks:
+            task.cancel()
+        if self._events is not None:
+            notifier.unsubscribe(RESPONSE_ANALYZED, self._events)
+
+    async def _write_answers(self) -> None:
+        while True:
+            item = await self._writes.get()
+            try:
+                async with AsyncSessionLocal() as db:
+                    response = InterviewResponse(
+                        interview_id=self.interview_id,
+                        status="pending",
+                        **item
+                    )
+                    db.add(response)
+                    await db.flush()
+                    await enqueue(db, "analyze_response", {"response_id": response.id}, user_id=self.user_id)
+                    await db.commit()
+                message = {"type": "saved", "question_id": item["question_id"], "response_id": response.id}
+            except Exception as e:
+                logger.error(f"Error saving answer for interview {self.interview_id}: {e}")
+                message = {"type": "error", "detail": "Answer could not be saved", "question_id": item["question_id"]}
+            finally:
+                self._writes.task_done()
+
+            try:
+                await self.send(message)
+            except Exception:
+                # The client is gone; the answer is saved regardless
+                pass
+
+    async def _forward_results(self) -> None:
+        while True:
+            event = await self._events.get()
+            if event.get("interview_id") == self.interview_id:
+                try:
+                    await self.send({"type": "analyzed", **event})
+                except Exception:
+                    return
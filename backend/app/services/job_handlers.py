@@ -0,0 +1,181 @@
+import asyncio
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict
+
+from sqlalchemy import select, update
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.interview import Interview, InterviewQuestion, InterviewResponse
+from app.models.resume import Resume
+from app.services.job_queue import PermanentJobError
+from app.services.llm_service import forget_session_context
+from app.services.latex_generator import generate_pdf_from_template
+from app.services.notifier import RESPONSE_ANALYZED, notify
+from app.services.resume_parser import parse_pdf, parse_docx, extract_resume_data
+from app.services.speech_analyzer import analyze_response
+
+logger = logging.getLogger(__name__)
+
+async def handle_analyze_response(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Score a submitted interview response with the LLM and publish the result
+
+    This score is provisional: completing the interview rescores every
+    answer in one batch (interview_completion.complete_interview_analysis),
+    and that batch owns the final score. So the job does nothing once the
+    interview is completed, and only writes responses still pending.
+
+    Preamble contexts are cached in the worker that ran the analysis, so a
+    job that finds its interview completed drops that interview's context
+    here; contexts no job revisits expire after LLM_CONTEXT_IDLE_SECONDS.
+    """
+    response_id = payload["response_id"]
+
+    # No connection is held while the LLM runs
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(
+                InterviewResponse.interview_id,
+                InterviewResponse.answer,
+                InterviewQuestion.question,
+                InterviewQuestion.category,
+                InterviewResponse.status,
+                Interview.job_description,
+                Interview.difficulty,
+                Interview.status.label("interview_status")
+            )
+            .join(InterviewQuestion, InterviewResponse.question_id == InterviewQuestion.id)
+            .join(Interview, InterviewResponse.interview_id == Interview.id)
+            .where(InterviewResponse.id == response_id)
+        )
+        row = result.first()
+    if row is None:
+        raise PermanentJobError(f"Response {response_id} no longer exists")
+    if row.interview_status == "completed":
+        forget_session_context(row.interview_id)
+    if row.status != "pending" or row.interview_status == "completed":
+        return {"response_id": response_id, "skipped": "already scored at completion"}
+
+    analysis = await analyze_response(
+        question=row.question,
+        answer=row.answer,
+        job_description=row.job_description,
+        interview_id=row.interview_id,
+        category=row.category,
+        difficulty=row.difficulty or "medium"
+    )
+
+    async with AsyncSessionLocal() as db:
+        # Completion may have run while the LLM was busy; its score wins
+        updated = await db.execute(
+            update(InterviewResponse)
+            .where((InterviewResponse.id == response_id) & (InterviewResponse.status == "pending"))
+            .values(
+                score=analysis["score"],
+                feedback=analysis["feedback"],
+                score_source=analysis.get("source", "heuristic"),
+                status="analyzed"
+            )
+        )
+        if updated.rowcount == 0:
+            forget_session_context(row.interview_id)
+            return {"response_id": response_id, "skipped": "already scored at completion"}
+        await notify(db, RESPONSE_ANALYZED, {
+            "id": response_id,
+            "interview_id": row.interview_id,
+            "status": "analyzed",
+            "score": analysis["score"],
+            "feedback": analysis["feedback"]
+        })
+        await db.commit()
+
+    return {"response_id": response_id, "score": analysis["score"], "source": analysis.get("source")}
+
+async def handle_parse_resume(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Parse an uploaded resume file and create the resume record"""
+    file_path = payload["file_path"]
+    parser = parse_pdf if file_path.lower().endswith(".pdf") else parse_docx
+    parse_result = await asyncio.to_thread(parser, file_path)
+    if "error" in parse_result:
+        raise PermanentJobError(f"Error parsing file: {parse_result['error']}")
+
+    resume_data = await asyncio.to_thread(extract_resume_data, parse_result["text"])
+
+    async with AsyncSessionLocal() as db:
+        # A retry after a lost completion must not create a second record
+        result = await db.execute(
+            select(Resume).where((Resume.user_id == payload["user_id"]) & (Resume.file_path == file_path))
+        )
+        existing = result.scalar_one_or_none()
+        if existing is not None:
+            return {
+                "id": existing.id,
+                "title": existing.title,
+                "full_name": existing.full_name,
+                "email": existing.email,
+                "phone": existing.phone,
+                "skills": json.loads(existing.skills or "[]")
+            }
+
+        new_resume = Resume(
+            user_id=payload["user_id"],
+            title=payload["title"],
+            full_name=resume_data["full_name"],
+            email=resume_data["email"],
+            phone=resume_data["phone"],
+            skills=json.dumps(resume_data["skills"]),
+            experience=json.dumps(resume_data["experience"]),
+            education=json.dumps(resume_data["education"]),
+            file_path=file_path
+        )
+        db.add(new_resume)
+        await db.commit()
+        await db.refresh(new_resume)
+
+    return {
+        "id": new_resume.id,
+        "title": new_resume.title,
+        "full_name": new_resume.full_name,
+        "email": new_resume.email,
+        "phone": new_resume.phone,
+        "skills": resume_data["skills"]
+    }
+
+async def handle_render_pdf(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Render a resume with a template into GENERATED_DIR"""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(Resume).where(Resume.id == payload["resume_id"]))
+        resume = result.scalar_one_or_none()
+    if resume is None:
+        raise PermanentJobError(f"Resume {payload['resume_id']} no longer exists")
+
+    template_id = payload.get("template_id", resume.template_id or 1)
+    resume_data = {
+        "full_name": resume.full_name,
+        "email": resume.email,
+        "phone": resume.phone,
+        "summary": resume.summary,
+        "skills": resume.skills,
+        "experience": resume.experience,
+        "education": resume.education
+    }
+    source = await asyncio.to_thread(generate_pdf_from_template, resume_data, template_id)
+    if not source:
+        raise RuntimeError("Template rendering failed")
+
+    # The generator emits LaTeX source; the document is compiled from this file
+    os.makedirs(settings.GENERATED_DIR, exist_ok=True)
+    filename = f"resume_{resume.id}_{template_id}_{datetime.utcnow().timestamp()}.tex"
+    with open(os.path.join(settings.GENERATED_DIR, filename), "w") as f:
+        f.write(source)
+    return {"resume_id": resume.id, "file": filename}
+
+JOB_HANDLERS = {
+    "analyze_response": handle_analyze_response,
+    "parse_resume": handle_parse_resume,
+    "render_pdf": handle_render_pdf
+}
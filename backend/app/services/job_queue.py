@@ -0,0 +1,291 @@
+import asyncio
+import json
+import logging
+import math
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.job import Job
+from app.services.notifier import JOB_ENQUEUED, notify
+
+logger = logging.getLogger(__name__)
+
+class PermanentJobError(Exception):
+    """Raised by a handler when retrying cannot succeed"""
+
+@dataclass
+class ClaimedJob:
+    id: int
+    job_type: str
+    payload: Dict[str, Any]
+    attempts: int
+    max_attempts: int
+
+async def enqueue(
+    db: AsyncSession,
+    job_type: str,
+    payload: Dict[str, Any],
+    priority: Optional[int] = None,
+    run_at: Optional[datetime] = None,
+    max_attempts: Optional[int] = None,
+    user_id: Optional[int] = None
+) -> Job:
+    """
+    Add a job on the caller's session
+
+    The job becomes visible to workers when the caller commits, together
+    with whatever rows the job refers to.
+    """
+    job = Job(
+        job_type=job_type,
+        payload=json.dumps(payload),
+        priority=settings.JOB_PRIORITIES.get(job_type, 0) if priority is None else priority,
+        status="queued",
+        attempts=0,
+        max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS,
+        run_at=run_at or datetime.utcnow(),
+        user_id=user_id
+    )
+    db.add(job)
+    await db.flush()
+    await notify(db, JOB_ENQUEUED, {"id": job.id, "job_type": job_type})
+    return job
+
+async def enqueue_many(
+    db: AsyncSession,
+    job_type: str,
+    payloads: List[Dict[str, Any]],
+    priority: Optional[int] = None,
+    user_id: Optional[int] = None
+) -> List[int]:
+    """Add jobs of one type with a single multi-row INSERT; returns their ids in order"""
+    if not payloads:
+        return []
+
+    now = datetime.utcnow()
+    result = await db.execute(
+        insert(Job).returning(Job.id, sort_by_parameter_order=True),
+        [
+            {
+                "job_type": job_type,
+                "payload": json.dumps(payload),
+                "priority": settings.JOB_PRIORITIES.get(job_type, 0) if priority is None else priority,
+                "status": "queued",
+                "attempts": 0,
+                "max_attempts": settings.JOB_MAX_ATTEMPTS,
+                "run_at": now,
+                "user_id": user_id
+            }
+            for payload in payloads
+        ]
+    )
+    job_ids = list(result.scalars().all())
+    await notify(db, JOB_ENQUEUED, {"id": job_ids[0], "job_type": job_type, "count": len(job_ids)})
+    return job_ids
+
+async def claim(job_type: str, limit: int, worker_id: str) -> List[ClaimedJob]:
+    """
+    Claim up to limit runnable jobs of one type
+
+    A job is runnable when it is queued and due, or when its previous claim
+    outlived the visibility timeout (the worker died). Rows locked by
+    another claimer are skipped rather than waited on.
+
+    Types listed in JOB_MAX_RUNNING are also capped across all workers:
+    claims of such a type serialize on a transaction-level advisory lock
+    and take only the slots left after the jobs already running.
+    """
+    now = datetime.utcnow()
+    max_running = settings.JOB_MAX_RUNNING.get(job_type)
+
+    async with AsyncSessionLocal() as db:
+        if max_running is not None:
+            await db.execute(select(func.pg_advisory_xact_lock(func.hashtext(f"jobs:{job_type}"))))
+            result = await db.execute(
+                select(func.count()).select_from(Job).where(
+                    (Job.job_type == job_type) & (Job.status == "running") & (Job.locked_until >= now)
+                )
+            )
+            limit = min(limit, max_running - result.scalar_one())
+            if limit <= 0:
+                await db.commit()
+                return []
+
+        candidates = (
+            select(Job.id)
+            .where(
+                (Job.job_type == job_type) &
+                (
+                    ((Job.status == "queued") & (Job.run_at <= now)) |
+                    ((Job.status == "running") & (Job.locked_until < now))
+                )
+            )
+            .order_by(Job.priority.desc(), Job.run_at, Job.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await db.execute(
+            update(Job)
+            .where(Job.id.in_(candidates))
+            .values(
+                status="running",
+                attempts=Job.attempts + 1,
+                locked_by=worker_id,
+                locked_until=now + timedelta(seconds=settings.JOB_VISIBILITY_TIMEOUT_SECONDS),
+                updated_at=now
+            )
+            .returning(Job.id, Job.job_type, Job.payload, Job.attempts, Job.max_attempts)
+            .execution_options(synchronize_session=False)
+        )
+        rows = result.all()
+        await db.commit()
+
+    return [
+        ClaimedJob(
+            id=row.id,
+            job_type=row.job_type,
+            payload=json.loads(row.payload),
+            attempts=row.attempts,
+            max_attempts=row.max_attempts
+        )
+        for row in rows
+    ]
+
+async def heartbeat(job_id: int, worker_id: str) -> bool:
+    """Extend the visibility timeout; False if the claim was lost"""
+    now = datetime.utcnow()
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            update(Job)
+            .where((Job.id == job_id) & (Job.locked_by == worker_id) & (Job.status == "running"))
+            .values(locked_until=now + timedelta(seconds=settings.JOB_VISIBILITY_TIMEOUT_SECONDS))
+        )
+        await db.commit()
+    return result.rowcount == 1
+
+async def complete(job_id: int, worker_id: str, result: Any = None) -> None:
+    """Mark a job succeeded, unless another worker has since reclaimed it"""
+    now = datetime.utcnow()
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(Job)
+            .where((Job.id == job_id) & (Job.locked_by == worker_id))
+            .values(
+                status="succeeded",
+                result=json.dumps(result),
+                locked_until=None,
+                updated_at=now,
+                finished_at=now
+            )
+        )
+        await db.commit()
+
+async def fail(job: ClaimedJob, worker_id: str, error: str, permanent: bool = False) -> None:
+    """
+    Record a failed attempt
+
+    The job is requeued with exponential backoff and jitter until it has
+    used max_attempts, then marked failed.
+    """
+    now = datetime.utcnow()
+    values: Dict[str, Any] = {"last_error": error[:2000], "locked_until": None, "updated_at": now}
+
+    if permanent or job.attempts >= job.max_attempts:
+        values.update(status="failed", finished_at=now)
+        logger.error(f"Job {job.id} ({job.job_type}) failed after {job.attempts} attempts: {error}")
+    else:
+        delay = min(settings.JOB_RETRY_MAX_SECONDS, settings.JOB_RETRY_BASE_SECONDS * 2 ** (job.attempts - 1))
+        values.update(status="queued", locked_by=None, run_at=now + timedelta(seconds=delay * random.uniform(0.5, 1.0)))
+        logger.warning(f"Job {job.id} ({job.job_type}) attempt {job.attempts} failed, retrying: {error}")
+
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(Job)
+            .where((Job.id == job.id) & (Job.locked_by == worker_id))
+            .values(**values)
+        )
+        await db.commit()
+
+class JobBacklog:
+    """
+    Number of queued jobs of one type, refreshed in the background
+
+    Exposes saturated and retry_after() like BoundedExecutor, so request
+    paths can shed load on a deep queue without a query per request.
+    Counting stops at the threshold, so a refresh reads at most that many
+    index entries however deep the queue grows.
+    """
+
+    def __init__(self, job_type: str, threshold: int, refresh_seconds: float):
+        self.job_type = job_type
+        self.threshold = threshold
+        self.refresh_seconds = refresh_seconds
+        self.queued = 0
+        self._last_refresh: Optional[float] = None
+
+    @property
+    def saturated(self) -> bool:
+        return self.queued >= self.threshold
+
+    def retry_after(self) -> int:
+        """Seconds until the backlog is counted again"""
+        return max(1, math.ceil(self.refresh_seconds))
+
+    async def refresh(self, db: AsyncSession) -> int:
+        """Count queued jobs up to the threshold"""
+        queued = (
+            select(Job.id)
+            .where((Job.job_type == self.job_type) & (Job.status == "queued"))
+            .limit(self.threshold)
+            .subquery()
+        )
+        result = await db.execute(select(func.count()).select_from(queued))
+        self.queued = result.scalar_one()
+        self._last_refresh = time.time()
+        return self.queued
+
+    async def run(self) -> None:
+        """Refresh every refresh_seconds until cancelled"""
+        while True:
+            try:
+                async with AsyncSessionLocal() as db:
+                    await self.refresh(db)
+            except Exception as e:
+                logger.error(f"Error counting {self.job_type} backlog: {e}")
+            await asyncio.sleep(self.refresh_seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the last count for monitoring"""
+        return {
+            "job_type": self.job_type,
+            "queued": self.queued,
+            "threshold": self.threshold,
+            "saturated": self.saturated,
+            "seconds_since_refresh": round(time.time() - self._last_refresh, 1) if self._last_refresh else None
+        }
+
+# Answers waiting for LLM scoring; the API sheds scoring requests past the threshold
+analysis_backlog = JobBacklog(
+    "analyze_response",
+    threshold=settings.SCORING_SHED_BACKLOG,
+    refresh_seconds=settings.JOB_BACKLOG_REFRESH_SECONDS
+)
+
+async def get_queue_stats(db: AsyncSession) -> Dict[str, Dict[str, int]]:
+    """Job counts by type and status"""
+    result = await db.execute(
+        select(Job.job_type, Job.status, func.count()).group_by(Job.job_type, Job.status)
+    )
+    stats: Dict[str, Dict[str, int]] = {}
+    for job_type, job_status, count in result.all():
+        stats.setdefault(job_type, {})[job_status] = count
+    return stats
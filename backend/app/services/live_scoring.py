@@ -0,0 +1,103 @@
+import logging
+from typing import Any, Dict
+
+from app.services.response_analyzer import (
+    EXAMPLE_KEYWORDS,
+    METRIC_KEYWORDS,
+    REFLECTION_KEYWORDS,
+    score_from_features
+)
+
+logger = logging.getLogger(__name__)
+
+KEYWORDS = sorted(set(EXAMPLE_KEYWORDS + METRIC_KEYWORDS + REFLECTION_KEYWORDS))
+MAX_KEYWORD_LENGTH = max(len(keyword) for keyword in KEYWORDS)
+
+def _count_occurrences(text: str, keyword: str) -> int:
+    """Count overlapping occurrences of keyword in text"""
+    count = 0
+    position = text.find(keyword)
+    while position != -1:
+        count += 1
+        position = text.find(keyword, position + 1)
+    return count
+
+def _count_word_starts(text: str, start: int, end: int) -> int:
+    """Count positions in [start, end) where a whitespace-delimited word begins"""
+    count = 0
+    for i in range(start, end):
+        if not text[i].isspace() and (i == 0 or text[i - 1].isspace()):
+            count += 1
+    return count
+
+class IncrementalAnswerState:
+    """
+    Scoring features of an answer being typed, updated from edits
+
+    Each edit replaces `delete` characters at `offset` with `insert`. Only a
+    window of MAX_KEYWORD_LENGTH characters around the edit is rescanned, so
+    the feature updates (word count, keyword occurrences, sentence count)
+    cost O(len(edit)) Python work regardless of answer length. Splicing the
+    edit into the stored text is still an O(len(text)) copy, but a single
+    memcpy that is negligible at answer sizes next to rescanning the text.
+    """
+
+    def __init__(self, category: str, difficulty: str = "medium", text: str = ""):
+        self.category = category
+        self.difficulty = difficulty
+        self.reset(text)
+
+    def reset(self, text: str) -> None:
+        """Recompute all features from full text"""
+        self.text = text
+        self.word_count = len(text.split())
+        self.dot_count = text.count(".")
+        lowered = text.lower()
+        self.keyword_counts = {keyword: _count_occurrences(lowered, keyword) for keyword in KEYWORDS}
+
+    def apply_edit(self, offset: int, delete: int, insert: str) -> None:
+        """Replace text[offset:offset + delete] with insert"""
+        old = self.text
+        if not 0 <= offset <= len(old) or delete < 0 or offset + delete > len(old):
+            raise ValueError("Edit is outside the current text")
+
+        new = old[:offset] + insert + old[offset + delete:]
+        old_end = offset + delete
+        new_end = offset + len(insert)
+
+        # Word starts can only change at the edited positions and the one after it
+        self.word_count += (
+            _count_word_starts(new, offset, min(len(new), new_end + 1))
+            - _count_word_starts(old, offset, min(len(old), old_end + 1))
+        )
+
+        self.dot_count += insert.count(".") - old.count(".", offset, old_end)
+
+        # Keyword occurrences touching the edit lie within one keyword length of it
+        reach = MAX_KEYWORD_LENGTH - 1
+        lo = max(0, offset - reach)
+        old_window = old[lo:min(len(old), old_end + reach)].lower()
+        new_window = new[lo:min(len(new), new_end + reach)].lower()
+        for keyword in KEYWORDS:
+            self.keyword_counts[keyword] += (
+                _count_occurrences(new_window, keyword) - _count_occurrences(old_window, keyword)
+            )
+
+        self.text = new
+
+    def score(self) -> Dict[str, Any]:
+        """Score from the current features"""
+        def any_keyword(keywords):
+            return any(self.keyword_counts[keyword] > 0 for keyword in keywords)
+
+        result = score_from_features(
+            word_count=self.word_count,
+            sentence_count=self.dot_count + 1,
+            has_examples=any_keyword(EXAMPLE_KEYWORDS),
+            has_metrics=any_keyword(METRIC_KEYWORDS),
+            has_reflection=any_keyword(REFLECTION_KEYWORDS),
+            category=self.category,
+            difficulty=self.difficulty
+        )
+        result["word_count"] = self.word_count
+        return result
@@ -0,0 +1,177 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.config import settings
+from app.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# First tier: per-process LRU
+_memory_cache = TTLCache(
+    max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.LLM_CACHE_TTL_SECONDS
+)
+
+_disk_stats = {
+    "hits": 0,
+    "misses": 0,
+    "writes": 0,
+    "evictions": 0,
+    "bytes": None  # computed lazily on first write
+}
+
+def make_cache_key(
+    model: str,
+    prompt: str,
+    options: Optional[Dict[str, Any]] = None,
+    context_reuse: bool = False
+) -> str:
+    """
+    Build cache key from model, prompt hash and generation params
+
+    Generations on top of a reused preamble context see different tokens
+    than the full prompt, so they are keyed separately via context_reuse.
+    """
+    prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    material = {"model": model, "prompt": prompt_hash, "options": options or {}}
+    if context_reuse:
+        material["context_reuse"] = True
+    material = json.dumps(material, sort_keys=True)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+def _entry_path(key: str) -> Path:
+    """Shard entries by key prefix to keep directories small"""
+    return Path(settings.LLM_CACHE_DIR) / key[:2] / f"{key}.json"
+
+def _read_disk(key: str) -> Optional[str]:
+    path = _entry_path(key)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Discarding unreadable LLM cache entry {path}: {e}")
+        _remove_entry(path)
+        return None
+
+    if time.time() - entry.get("created_at", 0) > settings.LLM_CACHE_TTL_SECONDS:
+        _remove_entry(path)
+        return None
+
+    # Touch so eviction sees this entry as recently used
+    os.utime(path, None)
+    return entry.get("response")
+
+def _write_disk(key: str, response: str) -> None:
+    path = _entry_path(key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Unique temp name, so concurrent writers of one key never share a file
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{key}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"created_at": time.time(), "response": response}, f)
+        try:
+            replaced = path.stat().st_size
+        except FileNotFoundError:
+            replaced = 0
+        os.replace(tmp_name, path)
+    finally:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+
+    if _disk_stats["bytes"] is None:
+        _disk_stats["bytes"] = _scan_disk_usage()
+    else:
+        _disk_stats["bytes"] += path.stat().st_size - replaced
+    _disk_stats["writes"] += 1
+
+    if _disk_stats["bytes"] > settings.LLM_CACHE_DISK_MAX_MB * 1024 * 1024:
+        _evict_disk()
+
+def _scan_disk_usage() -> int:
+    root = Path(settings.LLM_CACHE_DIR)
+    if not root.exists():
+        return 0
+    return sum(p.stat().st_size for p in root.glob("*/*.json"))
+
+def _remove_entry(path: Path) -> int:
+    try:
+        size = path.stat().st_size
+        path.unlink()
+        return size
+    except FileNotFoundError:
+        return 0
+
+def _evict_disk() -> None:
+    """
+    Remove least recently used entries until usage drops below 90% of the limit
+    """
+    limit = settings.LLM_CACHE_DISK_MAX_MB * 1024 * 1024 * 0.9
+    entries = sorted(
+        Path(settings.LLM_CACHE_DIR).glob("*/*.json"),
+        key=lambda p: p.stat().st_mtime
+    )
+    for path in entries:
+        if _disk_stats["bytes"] <= limit:
+            break
+        _disk_stats["bytes"] -= _remove_entry(path)
+        _disk_stats["evictions"] += 1
+
+async def get_cached_response(key: str) -> Optional[str]:
+    """
+    Look up a response in memory first, then on disk
+    """
+    response = _memory_cache.get(key)
+    if response is not None:
+        return response
+
+    try:
+        response = await asyncio.to_thread(_read_disk, key)
+    except Exception as e:
+        logger.error(f"Error reading LLM cache: {e}")
+        response = None
+
+    if response is None:
+        _disk_stats["misses"] += 1
+        return None
+
+    _disk_stats["hits"] += 1
+    _memory_cache.set(key, response)
+    return response
+
+async def set_cached_response(key: str, response: str) -> None:
+    """Store response in both tiers"""
+    _memory_cache.set(key, response)
+    try:
+        await asyncio.to_thread(_write_disk, key, response)
+    except Exception as e:
+        logger.error(f"Error writing LLM cache: {e}")
+
+def get_cache_stats() -> Dict[str, Any]:
+    """
+    Hit/miss counters for both tiers
+    """
+    memory = _memory_cache.stats()
+    lookups = memory["hits"] + memory["misses"]
+    hits = memory["hits"] + _disk_stats["hits"]
+    return {
+        "enabled": settings.LLM_CACHE_ENABLED,
+        "memory": memory,
+        "disk": {
+            "hits": _disk_stats["hits"],
+            "misses": _disk_stats["misses"],
+            "writes": _disk_stats["writes"],
+            "evictions": _disk_stats["evictions"],
+            "bytes": _disk_stats["bytes"] or 0
+        },
+        "hit_rate": round(hits / lookups, 4) if lookups else 0.0
+    }
@@ -1,41 +1,288 @@
+import asyncio
+import hashlib
 import logging
+import time
 import httpx
+from typing import List, Dict, Any, Optional
 from app.config import settings
+from app.services.llm_cache import make_cache_key, get_cached_response, set_cached_response
+from app.utils.cache import TTLCache
+from app.utils.circuit_breaker import CircuitBreaker
 
 logger = logging.getLogger(__name__)
 
-async def generate_text(prompt: str, model: str = None) -> str:
+_breaker = CircuitBreaker(
+    "ollama",
+    failure_threshold=settings.LLM_BREAKER_FAILURE_THRESHOLD,
+    reset_seconds=settings.LLM_BREAKER_RESET_SECONDS,
+    latency_slo_seconds=settings.LLM_LATENCY_SLO_SECONDS
+)
+
+# Upstream requests currently running, keyed by cache key
+_inflight: Dict[str, asyncio.Task] = {}
+
+# Ollama context after each session's shared preamble, evicted when idle
+_session_contexts = TTLCache(
+    max_entries=settings.LLM_CONTEXT_MAX_SESSIONS,
+    ttl_seconds=settings.LLM_CONTEXT_IDLE_SECONDS
+)
+_priming: Dict[str, asyncio.Task] = {}
+
+_request_stats = {
+    "upstream": 0,
+    "coalesced": 0,
+    "short_circuited": 0,
+    "deadline_exceeded": 0,
+    "context_reused": 0,
+    "context_primed": 0,
+    "prompt_eval_count": 0,
+    "prompt_eval_ms": 0.0
+}
+
+async def generate_text(
+    prompt: str,
+    model: str = None,
+    options: Optional[Dict[str, Any]] = None,
+    use_cache: bool = True,
+    preamble: Optional[str] = None,
+    session_id: Optional[Any] = None,
+    timeout: Optional[float] = None
+) -> str:
     """
     Generate text using Ollama LLM
-    
-    TODO: Implement Ollama integration for text generation
+
+    Responses are cached by (model, prompt hash, options); pass
+    use_cache=False to force a fresh generation that neither reads nor
+    writes the cache. Concurrent callers with the same key and use_cache
+    share one upstream request.
+
+    When a preamble and session_id are given, the preamble is evaluated once
+    per session and its Ollama context is reused for later prompts, so only
+    the prompt itself needs prefilling.
+
+    Returns "" on failure, when the timeout (default LLM_DEADLINE_SECONDS)
+    elapses, or immediately while the Ollama circuit breaker is open.
     """
     if model is None:
         model = settings.OLLAMA_MODEL
-    
-    logger.info(f"Generating text with model: {model}")
-    
+    if timeout is None:
+        timeout = settings.LLM_DEADLINE_SECONDS
+
+    full_prompt = f"{preamble}\n\n{prompt}" if preamble else prompt
+    reuse_context = bool(preamble) and session_id is not None and settings.LLM_CONTEXT_REUSE_ENABLED
+
+    cache_key = make_cache_key(model, full_prompt, options, context_reuse=reuse_context)
+    if use_cache and settings.LLM_CACHE_ENABLED:
+        cached = await get_cached_response(cache_key)
+        if cached is not None:
+            logger.info(f"LLM cache hit for model: {model}")
+            return cached
+
+    # Coalesce identical in-flight requests onto one upstream call; bypassing
+    # callers only share with each other, so their result is never cached
+    inflight_key = cache_key if use_cache else f"{cache_key}:fresh"
+    task = _inflight.get(inflight_key)
+    if task is None:
+        if not _breaker.allow_request():
+            _request_stats["short_circuited"] += 1
+            logger.warning("Ollama circuit breaker open, skipping generation")
+            return ""
+        _request_stats["upstream"] += 1
+        if reuse_context:
+            coro = _call_with_context(session_id, preamble, prompt, model, options, cache_key, use_cache)
+        else:
+            coro = _call_ollama(full_prompt, model, options, cache_key, use_cache=use_cache)
+        task = asyncio.create_task(_upstream(coro, max(timeout, settings.LLM_DEADLINE_SECONDS)))
+        _inflight[inflight_key] = task
+        task.add_done_callback(lambda done: _discard(_inflight, inflight_key, done))
+    else:
+        _request_stats["coalesced"] += 1
+        logger.info(f"Coalesced LLM request for model: {model}")
+
+    # Shield so a cancelled or timed-out caller does not cancel the shared request
     try:
-        async with httpx.AsyncClient() as client:
+        return await asyncio.wait_for(asyncio.shield(task), timeout)
+    except asyncio.TimeoutError:
+        _request_stats["deadline_exceeded"] += 1
+        logger.warning(f"LLM request exceeded deadline of {timeout}s")
+        return ""
+
+def _discard(registry: Dict[str, asyncio.Task], key: str, task: asyncio.Task) -> None:
+    """Remove a finished task, unless a newer task has taken its key"""
+    if registry.get(key) is task:
+        del registry[key]
+
+async def _upstream(coro, deadline: float) -> str:
+    """
+    Run one logical generation (which may take several posts) within a
+    deadline, recording a single success or failure with the breaker
+    """
+    started = time.monotonic()
+    try:
+        text = await asyncio.wait_for(coro, deadline)
+    except asyncio.TimeoutError:
+        logger.warning(f"Upstream LLM request cancelled after {deadline}s")
+        text = ""
+
+    if text:
+        _breaker.record_success(time.monotonic() - started)
+    else:
+        _breaker.record_failure()
+    return text
+
+async def _post_generate(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """POST to Ollama /api/generate and return the decoded body"""
+    try:
+        timeout = httpx.Timeout(settings.LLM_TIMEOUT_SECONDS, connect=settings.LLM_CONNECT_TIMEOUT_SECONDS)
+        async with httpx.AsyncClient(timeout=timeout) as client:
             response = await client.post(
                 f"{settings.OLLAMA_BASE_URL}/api/generate",
-                json={
-                    "model": model,
-                    "prompt": prompt,
-                    "stream": False
-                }
+                json=payload
             )
             if response.status_code == 200:
-                return response.json().get("response", "")
+                result = response.json()
+                _request_stats["prompt_eval_count"] += result.get("prompt_eval_count", 0)
+                _request_stats["prompt_eval_ms"] += result.get("prompt_eval_duration", 0) / 1e6
+                return result
+            logger.error(f"Ollama returned status {response.status_code}")
     except Exception as e:
         logger.error(f"Error generating text: {e}")
-    
-    return ""
+    return None
+
+def llm_available() -> bool:
+    """False while the Ollama circuit breaker is open"""
+    return _breaker.state != CircuitBreaker.OPEN
+
+async def _call_ollama(
+    prompt: str,
+    model: str,
+    options: Optional[Dict[str, Any]],
+    cache_key: str,
+    context: Optional[List[int]] = None,
+    use_cache: bool = True
+) -> str:
+    """Issue a single upstream generate request, caching the text if use_cache"""
+    logger.info(f"Generating text with model: {model}")
+
+    payload = {
+        "model": model,
+        "prompt": prompt,
+        "stream": False
+    }
+    if options:
+        payload["options"] = options
+    if context:
+        payload["context"] = context
+
+    result = await _post_generate(payload)
+    if result is None:
+        return ""
+
+    text = result.get("response", "")
+    if text and use_cache and settings.LLM_CACHE_ENABLED:
+        await set_cached_response(cache_key, text)
+    return text
+
+async def _call_with_context(
+    session_id: Any,
+    preamble: str,
+    prompt: str,
+    model: str,
+    options: Optional[Dict[str, Any]],
+    cache_key: str,
+    use_cache: bool = True
+) -> str:
+    """
+    Generate on top of the session's preamble context, falling back to
+    sending the full prompt if the context is unavailable
+
+    Only generations that actually used the context are cached under
+    cache_key; the fallback is cached under the full prompt's own key.
+    """
+    context = await _get_preamble_context(session_id, preamble, model)
+    if context:
+        _request_stats["context_reused"] += 1
+        text = await _call_ollama(prompt, model, options, cache_key, context=context, use_cache=use_cache)
+        if text:
+            return text
+
+    full_prompt = f"{preamble}\n\n{prompt}"
+    full_key = make_cache_key(model, full_prompt, options)
+    return await _call_ollama(full_prompt, model, options, full_key, use_cache=use_cache)
+
+async def _get_preamble_context(session_id: Any, preamble: str, model: str) -> Optional[List[int]]:
+    """
+    Return the Ollama context for a session's preamble, evaluating it once
+    """
+    preamble_hash = hashlib.sha256(f"{model}\n{preamble}".encode("utf-8")).hexdigest()
+    entry = _session_contexts.get(session_id)
+    if entry and entry["preamble_hash"] == preamble_hash:
+        # Re-store to push back the idle deadline
+        _session_contexts.set(session_id, entry)
+        return entry["context"]
+
+    prime_key = f"{session_id}:{preamble_hash}"
+    task = _priming.get(prime_key)
+    if task is None:
+        task = asyncio.create_task(_prime_context(preamble, model))
+        _priming[prime_key] = task
+        task.add_done_callback(lambda done: _discard(_priming, prime_key, done))
+
+    context = await asyncio.shield(task)
+    if context:
+        _session_contexts.set(session_id, {"preamble_hash": preamble_hash, "context": context})
+    return context
+
+async def _prime_context(preamble: str, model: str) -> Optional[List[int]]:
+    """
+    Evaluate the preamble alone and keep the resulting context
+
+    The context includes the templated turn and one generated token, so
+    prompts sent on top of it are not token-identical to the full prompt;
+    make_cache_key keeps their results apart. Raw mode would avoid that,
+    but Ollama returns no context for raw requests.
+    """
+    logger.info(f"Priming LLM context with model: {model}")
+    _request_stats["context_primed"] += 1
+
+    result = await _post_generate({
+        "model": model,
+        "prompt": preamble,
+        "stream": False,
+        "options": {"num_predict": 1}
+    })
+    if result is None:
+        return None
+    return result.get("context")
+
+def forget_session_context(session_id: Any) -> None:
+    """Drop a session's cached preamble context"""
+    _session_contexts.pop(session_id)
+
+def get_llm_stats() -> Dict[str, Any]:
+    """
+    Counters for upstream vs coalesced generate requests and context reuse
+    """
+    total = _request_stats["upstream"] + _request_stats["coalesced"]
+    return {
+        "upstream_calls": _request_stats["upstream"],
+        "coalesced_calls": _request_stats["coalesced"],
+        "in_flight": len(_inflight),
+        "coalesce_rate": round(_request_stats["coalesced"] / total, 4) if total else 0.0,
+        "context_sessions": _session_contexts.stats(),
+        "context_reused": _request_stats["context_reused"],
+        "context_primed": _request_stats["context_primed"],
+        "prompt_eval_count": _request_stats["prompt_eval_count"],
+        "prompt_eval_ms": round(_request_stats["prompt_eval_ms"], 2),
+        "short_circuited": _request_stats["short_circuited"],
+        "deadline_exceeded": _request_stats["deadline_exceeded"],
+        "breaker": _breaker.stats()
+    }
 
 async def generate_embeddings(text: str) -> List[float]:
     """
     Generate embeddings for text using sentence-transformers
-    
+
     TODO: Implement embedding generation
     """
     logger.info("Generating embeddings")
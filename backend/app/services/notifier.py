@@ -0,0 +1,97 @@
+import asyncio
+import json
+import logging
+from typing import Any, Dict, Set
+
+import asyncpg
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+JOB_ENQUEUED = "job_enqueued"
+RESPONSE_ANALYZED = "response_analyzed"
+USER_CHANGED = "user_changed"
+
+async def notify(db: AsyncSession, channel: str, payload: Dict[str, Any]) -> None:
+    """
+    Queue a NOTIFY on the session's transaction
+
+    Postgres delivers it only when the transaction commits, so listeners
+    never see rows that were rolled back.
+    """
+    await db.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": channel, "payload": json.dumps(payload)}
+    )
+
+class PostgresNotifier:
+    """
+    Process-wide LISTEN connection fanned out to in-process subscribers
+
+    A single dedicated connection serves every subscriber in the process, so
+    open WebSockets and worker loops do not each hold a pooled connection.
+    Events are best-effort: subscribers should also poll for state they may
+    have missed while the connection was down.
+    """
+
+    def __init__(self, dsn: str):
+        self.dsn = dsn
+        self._connection = None
+        self._connect_lock = asyncio.Lock()
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+
+    async def subscribe(self, channel: str, max_queued: int = 100) -> asyncio.Queue:
+        """Return a queue that receives decoded payloads sent on channel"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max_queued)
+        await self._ensure_connection()
+        if channel not in self._subscribers:
+            self._subscribers[channel] = set()
+            await self._connection.add_listener(channel, self._dispatch)
+        self._subscribers[channel].add(queue)
+        return queue
+
+    def unsubscribe(self, channel: str, queue: asyncio.Queue) -> None:
+        self._subscribers.get(channel, set()).discard(queue)
+
+    async def close(self) -> None:
+        if self._connection is not None and not self._connection.is_closed():
+            await self._connection.close()
+        self._connection = None
+        self._subscribers.clear()
+
+    async def _ensure_connection(self) -> None:
+        if self._connection is not None and not self._connection.is_closed():
+            return
+
+        async with self._connect_lock:
+            if self._connection is not None and not self._connection.is_closed():
+                return
+            self._connection = await asyncpg.connect(self.dsn)
+            self._connection.add_termination_listener(self._on_terminated)
+            for channel in self._subscribers:
+                await self._connection.add_listener(channel, self._dispatch)
+            logger.info(f"Listening for notifications on {len(self._subscribers)} channels")
+
+    def _on_terminated(self, connection) -> None:
+        logger.warning("Notification connection lost; reconnecting on next subscribe")
+        self._connection = None
+
+    def _dispatch(self, connection, pid: int, channel: str, payload: str) -> None:
+        try:
+            event = json.loads(payload)
+        except json.JSONDecodeError:
+            logger.warning(f"Ignoring malformed notification on {channel}")
+            return
+
+        for queue in list(self._subscribers.get(channel, ())):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # A slow consumer only loses events; it still sees state when it polls
+                logger.warning(f"Dropping notification on {channel} for a slow subscriber")
+
+# One LISTEN connection per process; asyncpg takes the DSN without the driver suffix
+notifier = PostgresNotifier(settings.DATABASE_URL.replace("+asyncpg", ""))
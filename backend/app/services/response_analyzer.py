@@ -1,9 +1,18 @@
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List
 import re
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Minimum/maximum word count for a good answer
+MIN_WORDS = {"easy": 20, "medium": 40, "hard": 60}
+MAX_WORDS = {"easy": 100, "medium": 200, "hard": 300}
+
+EXAMPLE_KEYWORDS = ["for example", "specifically", "instance", "case", "project", "situation"]
+METRIC_KEYWORDS = ["increased", "decreased", "improved", "reduced", "%", "number", "result"]
+REFLECTION_KEYWORDS = ["learned", "realized", "understood", "improved", "next time", "going forward"]
+
 def analyze_response(
     question: str,
     answer: str,
@@ -50,13 +59,9 @@ def calculate_base_score(answer: str, category: str, difficulty: str) -> float:
     """
     Calculate base score based on answer length and content
     """
-    # Minimum word count for a good answer
-    min_words = {"easy": 20, "medium": 40, "hard": 60}
-    max_words = {"easy": 100, "medium": 200, "hard": 300}
-    
     word_count = len(answer.split())
-    min_w = min_words.get(difficulty, 40)
-    max_w = max_words.get(difficulty, 200)
+    min_w = MIN_WORDS.get(difficulty, 40)
+    max_w = MAX_WORDS.get(difficulty, 200)
     
     # Score based on word count
     if word_count < min_w:
@@ -83,20 +88,17 @@ def analyze_response_quality(answer: str) -> Dict[str, Any]:
     answer_lower = answer.lower()
     
     # Check for specific examples
-    example_keywords = ["for example", "specifically", "instance", "case", "project", "situation"]
-    if any(keyword in answer_lower for keyword in example_keywords):
+    if any(keyword in answer_lower for keyword in EXAMPLE_KEYWORDS):
         metrics["has_examples"] = 1
         metrics["adjustment"] += 10
     
     # Check for metrics/results
-    metric_keywords = ["increased", "decreased", "improved", "reduced", "%", "number", "result"]
-    if any(keyword in answer_lower for keyword in metric_keywords):
+    if any(keyword in answer_lower for keyword in METRIC_KEYWORDS):
         metrics["has_metrics"] = 1
         metrics["adjustment"] += 10
     
     # Check for reflection/learning
-    reflection_keywords = ["learned", "realized", "understood", "improved", "next time", "going forward"]
-    if any(keyword in answer_lower for keyword in reflection_keywords):
+    if any(keyword in answer_lower for keyword in REFLECTION_KEYWORDS):
         metrics["has_reflection"] = 1
         metrics["adjustment"] += 5
     
@@ -117,11 +119,15 @@ def generate_feedback(
     answer: str,
     category: str,
     quality_metrics: Dict,
-    score: float
+    score: float,
+    word_count: int = None
 ) -> str:
     """
     Generate constructive feedback for the response
     """
+    if word_count is None:
+        word_count = len(answer.split())
+    
     feedback_parts = []
     
     if score >= 80:
@@ -141,7 +147,7 @@ def generate_feedback(
     elif category == "technical":
         if not quality_metrics.get("has_metrics"):
             feedback_parts.append("Include specific technical details or metrics in your answer.")
-        if len(answer.split()) < 50:
+        if word_count < 50:
             feedback_parts.append("Provide more detailed technical explanation.")
     
     elif category == "situational":
@@ -153,3 +159,128 @@ def generate_feedback(
         feedback_parts.append("Try to use clearer, more concise sentences.")
     
     return " ".join(feedback_parts)
+
+def score_from_features(
+    word_count: int,
+    sentence_count: int,
+    has_examples: bool,
+    has_metrics: bool,
+    has_reflection: bool,
+    category: str,
+    difficulty: str = "medium"
+) -> Dict[str, Any]:
+    """
+    Score an answer from precomputed features
+
+    Same rules as analyze_response, for callers that maintain the features
+    themselves.
+    """
+    min_w = MIN_WORDS.get(difficulty, 40)
+    max_w = MAX_WORDS.get(difficulty, 200)
+    if word_count < min_w:
+        base_score = (word_count / min_w) * 50
+    elif word_count > max_w:
+        base_score = 50 + ((max_w - word_count) / max_w) * 50
+    else:
+        base_score = 50 + ((word_count - min_w) / (max_w - min_w)) * 50
+    base_score = max(0, min(100, base_score))
+
+    avg_sentence_length = word_count / sentence_count
+    quality_metrics = {
+        "has_examples": int(has_examples),
+        "has_metrics": int(has_metrics),
+        "has_reflection": int(has_reflection),
+        "clarity_score": int(10 < avg_sentence_length < 25),
+        "adjustment": 0
+    }
+    quality_metrics["adjustment"] = min(
+        10 * quality_metrics["has_examples"]
+        + 10 * quality_metrics["has_metrics"]
+        + 5 * quality_metrics["has_reflection"]
+        + 5 * quality_metrics["clarity_score"],
+        30
+    )
+
+    final_score = min(100, max(0, base_score + quality_metrics["adjustment"]))
+    return {
+        "score": round(final_score, 2),
+        "base_score": round(base_score, 2),
+        "quality_metrics": quality_metrics,
+        "feedback": generate_feedback("", category, quality_metrics, final_score, word_count),
+        "category": category
+    }
+
+def analyze_responses_batch(
+    answers: List[str],
+    categories: List[str],
+    difficulties: List[str]
+) -> List[Dict[str, Any]]:
+    """
+    Score many answers at once
+
+    Word counts, keyword flags and sentence statistics are computed as
+    arrays over the whole batch; results match analyze_response per answer.
+    """
+    if not answers:
+        return []
+
+    # Scan the whole batch at once: answers joined by NUL, which no keyword contains
+    lowered = [answer.lower() for answer in answers]
+    corpus = "\x00".join(lowered)
+    row_starts = np.cumsum([0] + [len(answer) + 1 for answer in lowered[:-1]])
+    word_counts = np.fromiter((len(answer.split()) for answer in answers), dtype=np.float64, count=len(answers))
+    sentence_counts = np.fromiter((answer.count(".") for answer in answers), dtype=np.float64, count=len(answers)) + 1
+
+    # One regex pass per metric; each match consumes the rest of its answer,
+    # so there is at most one match per answer
+    def keyword_flags(keywords: List[str]) -> np.ndarray:
+        pattern = re.compile("(?:" + "|".join(re.escape(k) for k in keywords) + ")[^\x00]*")
+        hits = np.fromiter((m.start() for m in pattern.finditer(corpus)), dtype=np.int64)
+        flags = np.zeros(len(answers), dtype=np.int64)
+        flags[np.searchsorted(row_starts, hits, side="right") - 1] = 1
+        return flags
+
+    has_examples = keyword_flags(EXAMPLE_KEYWORDS)
+    has_metrics = keyword_flags(METRIC_KEYWORDS)
+    has_reflection = keyword_flags(REFLECTION_KEYWORDS)
+
+    avg_sentence_length = word_counts / sentence_counts
+    clarity = ((avg_sentence_length > 10) & (avg_sentence_length < 25)).astype(np.int64)
+
+    adjustment = np.minimum(10 * has_examples + 10 * has_metrics + 5 * has_reflection + 5 * clarity, 30)
+
+    # Base score from word count, same piecewise rule as calculate_base_score
+    min_w = np.array([MIN_WORDS.get(d, 40) for d in difficulties], dtype=np.float64)
+    max_w = np.array([MAX_WORDS.get(d, 200) for d in difficulties], dtype=np.float64)
+    base = np.where(
+        word_counts < min_w,
+        (word_counts / min_w) * 50,
+        np.where(
+            word_counts > max_w,
+            50 + ((max_w - word_counts) / max_w) * 50,
+            50 + ((word_counts - min_w) / (max_w - min_w)) * 50
+        )
+    )
+    base = np.clip(base, 0, 100)
+    final = np.clip(base + adjustment, 0, 100)
+
+    results = []
+    for idx, (answer, category) in enumerate(zip(answers, categories)):
+        quality_metrics = {
+            "has_examples": int(has_examples[idx]),
+            "has_metrics": int(has_metrics[idx]),
+            "has_reflection": int(has_reflection[idx]),
+            "clarity_score": int(clarity[idx]),
+            "adjustment": int(adjustment[idx])
+        }
+        score = float(final[idx])
+        results.append({
+            "score": round(score, 2),
+            "base_score": round(float(base[idx]), 2),
+            "quality_metrics": quality_metrics,
+            "feedback": generate_feedback(answer, category, quality_metrics, score, int(word_counts[idx])),
+            "category": category
+        })
+
+    logger.info(f"Batch analyzed {len(results)} responses")
+    return results
@@ -5,8 +5,18 @@ import re
 import os
 from pathlib import Path
 
+from app.config import settings
+from app.utils.executors import BoundedExecutor
+
 logger = logging.getLogger(__name__)
 
+# PDF/DOCX text extraction for requests, off the event loop and bounded
+parse_executor = BoundedExecutor(
+    "resume_parse",
+    workers=settings.PARSE_WORKERS,
+    max_queue=settings.PARSE_MAX_QUEUE
+)
+
 def parse_pdf(file_path: str) -> Dict[str, Any]:
     """
     Parse PDF resume file and extract text and structured data
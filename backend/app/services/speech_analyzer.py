@@ -1,6 +1,12 @@
+import asyncio
+import json
 import logging
-from typing import Dict, Any
-from app.services.llm_service import generate_text
+import re
+from typing import Dict, Any, List, Optional
+from app.config import settings
+from app.services.llm_service import generate_text, llm_available
+from app.services.response_analyzer import analyze_response as heuristic_analyze_response
+from app.services.transcription_engine import transcription_engine
 
 logger = logging.getLogger(__name__)
 
@@ -9,10 +15,7 @@ async def transcribe_audio(audio_file_path: str) -> str:
     Transcribe audio file using Whisper
     """
     try:
-        import whisper
-        model = whisper.load_model("base")
-        result = model.transcribe(audio_file_path)
-        transcription = result["text"]
+        transcription = await transcription_engine.transcribe(audio_file_path)
         logger.info(f"Successfully transcribed audio: {audio_file_path}")
         return transcription
     except Exception as e:
@@ -22,21 +25,101 @@ async def transcribe_audio(audio_file_path: str) -> str:
 async def analyze_response(
     question: str,
     answer: str,
-    job_description: str
+    job_description: str,
+    use_cache: bool = True,
+    interview_id: Optional[int] = None,
+    category: str = "general",
+    difficulty: str = "medium",
+    timeout: Optional[float] = None
 ) -> Dict[str, Any]:
     """
     Analyze interview response for quality and relevance
+
+    The prompt is fully determined by its inputs, so repeated analyses are
+    served from the LLM cache unless use_cache is False. Passing interview_id
+    lets the LLM reuse the evaluated job description across an interview.
+
+    Falls back to the deterministic heuristic scorer when the LLM is
+    unavailable, misses its deadline or returns an unparseable answer.
     """
+    if not llm_available():
+        return heuristic_analysis(question, answer, category, difficulty)
+
     try:
-        prompt = f"""Analyze this interview response and provide feedback.
+        preamble = build_analysis_preamble(job_description)
+        prompt = f"""Question: {question}
+
+Candidate's Answer: {answer}"""
+        
+        response = await generate_text(
+            prompt,
+            use_cache=use_cache,
+            preamble=preamble,
+            session_id=interview_id,
+            timeout=timeout
+        )
+        if not response:
+            return heuristic_analysis(question, answer, category, difficulty)
+
+        analysis = parse_analysis_response(response)
+        if not analysis["score"] and not analysis["feedback"]:
+            logger.warning("Unparseable LLM analysis, using heuristic scorer")
+            return heuristic_analysis(question, answer, category, difficulty)
+        analysis["source"] = "llm"
+        
+        logger.info(f"Analyzed interview response with score: {analysis['score']}")
+        return analysis
+    except Exception as e:
+        logger.error(f"Error analyzing response: {e}")
+        return heuristic_analysis(question, answer, category, difficulty)
+
+def heuristic_analysis(
+    question: str,
+    answer: str,
+    category: str,
+    difficulty: str
+) -> Dict[str, Any]:
+    """
+    Score with the rule-based analyzer, shaped like an LLM analysis
+    """
+    result = heuristic_analyze_response(question, answer, category, difficulty)
+    metrics = result.get("quality_metrics", {})
 
-Question: {question}
+    strengths = []
+    improvements = []
+    if metrics.get("has_examples"):
+        strengths.append("Uses specific examples")
+    else:
+        improvements.append("Include specific examples from your experience")
+    if metrics.get("has_metrics"):
+        strengths.append("Quantifies results")
+    else:
+        improvements.append("Quantify the impact of your work")
+    if metrics.get("has_reflection"):
+        strengths.append("Reflects on lessons learned")
+    else:
+        improvements.append("Discuss what you learned")
+    if metrics.get("clarity_score"):
+        strengths.append("Clear sentence structure")
 
-Candidate's Answer: {answer}
+    logger.info(f"Heuristic analysis used with score: {result['score']}")
+    return {
+        "score": result["score"],
+        "feedback": result["feedback"],
+        "strengths": strengths,
+        "improvements": improvements,
+        "source": "heuristic"
+    }
+
+def build_analysis_preamble(job_description: str) -> str:
+    """
+    Shared prompt prefix for every answer in an interview
+    """
+    return f"""You are evaluating answers from a mock interview.
 
 Job Requirements: {job_description}
 
-Provide analysis in the following format:
+Analyze each interview response you are given and provide feedback in the following format:
 SCORE: (0-100)
 STRENGTHS:
 - Point 1
@@ -45,20 +128,6 @@ IMPROVEMENTS:
 - Point 1
 - Point 2
 FEEDBACK: Brief overall feedback"""
-        
-        response = await generate_text(prompt)
-        analysis = parse_analysis_response(response)
-        
-        logger.info(f"Analyzed interview response with score: {analysis['score']}")
-        return analysis
-    except Exception as e:
-        logger.error(f"Error analyzing response: {e}")
-        return {
-            "score": 0,
-            "feedback": "Error analyzing response",
-            "strengths": [],
-            "improvements": []
-        }
 
 def parse_analysis_response(response: str) -> Dict[str, Any]:
     """Parse analysis response from LLM"""
@@ -107,3 +176,168 @@ def parse_analysis_response(response: str) -> Dict[str, Any]:
             "strengths": [],
             "improvements": []
         }
+
+async def analyze_interview_batch(
+    job_description: str,
+    items: List[Dict[str, Any]],
+    interview_id: Optional[int] = None,
+    use_cache: bool = True,
+    timeout: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """
+    Analyze all answers of an interview with a single LLM call
+
+    Each item needs question, answer, category and difficulty. Answers the
+    batch output does not cover are re-analyzed one at a time.
+    """
+    if not items:
+        return []
+
+    if not llm_available():
+        return [
+            heuristic_analysis(item["question"], item["answer"], item["category"], item["difficulty"])
+            for item in items
+        ]
+
+    parsed: Dict[int, Dict[str, Any]] = {}
+    try:
+        response = await generate_text(
+            build_batch_prompt(items),
+            use_cache=use_cache,
+            preamble=build_batch_preamble(job_description),
+            timeout=timeout or settings.LLM_BATCH_DEADLINE_SECONDS
+        )
+        parsed = parse_batch_analysis_response(response, len(items))
+    except Exception as e:
+        logger.error(f"Error in batch analysis: {e}")
+
+    missing = [idx for idx in range(len(items)) if idx not in parsed]
+    if missing:
+        logger.warning(f"Batch analysis missing {len(missing)} of {len(items)} answers, analyzing individually")
+        fallbacks = await asyncio.gather(*(
+            analyze_response(
+                question=items[idx]["question"],
+                answer=items[idx]["answer"],
+                job_description=job_description,
+                use_cache=use_cache,
+                interview_id=interview_id,
+                category=items[idx]["category"],
+                difficulty=items[idx]["difficulty"],
+                timeout=timeout
+            )
+            for idx in missing
+        ))
+        parsed.update(zip(missing, fallbacks))
+
+    logger.info(f"Batch analyzed {len(items)} answers ({len(missing)} individually)")
+    return [parsed[idx] for idx in range(len(items))]
+
+def build_batch_preamble(job_description: str) -> str:
+    """
+    Instructions for evaluating several answers in one response
+    """
+    return f"""You are evaluating answers from a mock interview.
+
+Job Requirements: {job_description}
+
+You will be given numbered interview questions with the candidate's answers.
+Respond with only a JSON array containing one object per answer, in the same order:
+[{{"index": 1, "score": <0-100>, "strengths": ["..."], "improvements": ["..."], "feedback": "brief overall feedback"}}]"""
+
+def build_batch_prompt(items: List[Dict[str, Any]]) -> str:
+    """Number each question/answer pair"""
+    parts = []
+    for idx, item in enumerate(items, 1):
+        parts.append(f"""{idx}. Question: {item["question"]}
+Candidate's Answer: {item["answer"]}""")
+    return "\n\n".join(parts)
+
+def parse_batch_analysis_response(response: str, count: int) -> Dict[int, Dict[str, Any]]:
+    """
+    Parse a batch analysis into {zero-based index: analysis}
+
+    Tolerates code fences, surrounding prose, a wrapping object, truncated
+    arrays and loosely typed fields; entries that cannot be validated are
+    left out so the caller can retry them individually.
+    """
+    entries = _extract_json_entries(response or "")
+
+    results: Dict[int, Dict[str, Any]] = {}
+    for position, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            continue
+
+        index = entry.get("index", entry.get("question", position + 1))
+        try:
+            index = int(index) - 1
+        except (TypeError, ValueError):
+            index = position
+        if not 0 <= index < count or index in results:
+            continue
+
+        score = _coerce_score(entry.get("score"))
+        if score is None:
+            continue
+
+        results[index] = {
+            "score": score,
+            "feedback": str(entry.get("feedback") or "").strip(),
+            "strengths": _coerce_points(entry.get("strengths")),
+            "improvements": _coerce_points(entry.get("improvements")),
+            "source": "llm"
+        }
+    return results
+
+def _extract_json_entries(response: str) -> List[Any]:
+    text = re.sub(r"```(?:json)?", "", response)
+
+    start, end = text.find("["), text.rfind("]")
+    if start != -1 and end > start:
+        try:
+            data = json.loads(text[start:end + 1])
+            if isinstance(data, list):
+                return data
+        except json.JSONDecodeError:
+            pass
+
+    try:
+        data = json.loads(text.strip())
+        if isinstance(data, dict):
+            for value in data.values():
+                if isinstance(value, list):
+                    return value
+    except json.JSONDecodeError:
+        pass
+
+    # Fall back to decoding each top-level {...} object independently
+    entries = []
+    decoder = json.JSONDecoder()
+    position = text.find("{")
+    while position != -1:
+        try:
+            obj, consumed = decoder.raw_decode(text, position)
+            if isinstance(obj, dict) and "score" in obj:
+                entries.append(obj)
+                position = text.find("{", consumed)
+                continue
+        except json.JSONDecodeError:
+            pass
+        position = text.find("{", position + 1)
+    return entries
+
+def _coerce_score(value: Any) -> Optional[float]:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        score = float(value)
+    else:
+        match = re.search(r"\d+(?:\.\d+)?", str(value or ""))
+        if not match:
+            return None
+        score = float(match.group())
+    return max(0.0, min(100.0, score))
+
+def _coerce_points(value: Any) -> List[str]:
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, list):
+        return []
+    return [str(point).strip() for point in value if str(point).strip()]
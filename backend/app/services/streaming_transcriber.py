@@ -0,0 +1,199 @@
+import asyncio
+import logging
+import wave
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import numpy as np
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+FRAME_MS = 30
+FRAME_SAMPLES = SAMPLE_RATE * FRAME_MS // 1000
+PRE_SPEECH_MS = 210
+
+class RecordingTooLong(Exception):
+    """Raised when a streamed recording exceeds STREAMING_MAX_RECORDING_SECONDS"""
+
+class VoiceActivitySegmenter:
+    """
+    Split a stream of 16 kHz mono PCM16 audio into speech segments
+
+    Frames are classified by RMS energy. A segment closes after
+    STREAMING_SILENCE_MS of silence or when it reaches
+    STREAMING_MAX_SEGMENT_SECONDS, so each segment can be transcribed while
+    the speaker is still talking. Bursts shorter than min_speech_ms are
+    dropped as noise mid-stream, but the final segment is kept whenever it
+    holds any speech, so one-word answers ("yes", a number) survive.
+    """
+
+    def __init__(
+        self,
+        energy_threshold: float = None,
+        silence_ms: int = None,
+        max_segment_seconds: float = None,
+        min_speech_ms: int = 100
+    ):
+        self.energy_threshold = energy_threshold or settings.STREAMING_VAD_THRESHOLD
+        self.silence_frames = (silence_ms or settings.STREAMING_SILENCE_MS) // FRAME_MS
+        self.max_segment_frames = int(
+            (max_segment_seconds or settings.STREAMING_MAX_SEGMENT_SECONDS) * 1000 / FRAME_MS
+        )
+        self.min_speech_frames = min_speech_ms // FRAME_MS
+        self.pre_speech_frames = PRE_SPEECH_MS // FRAME_MS
+
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._leftover = b""
+        self._frames: List[np.ndarray] = []
+        self._speech_frames = 0
+        self._trailing_silence = 0
+        self._in_speech = False
+
+    def feed(self, chunk: bytes) -> List[np.ndarray]:
+        """Add PCM16 little-endian bytes; return any segments that closed"""
+        data = self._leftover + chunk
+        usable = len(data) - len(data) % 2
+        self._leftover = data[usable:]
+
+        samples = np.frombuffer(data[:usable], dtype="<i2").astype(np.float32) / 32768.0
+        self._pending = np.concatenate([self._pending, samples])
+
+        segments = []
+        while len(self._pending) >= FRAME_SAMPLES:
+            frame = self._pending[:FRAME_SAMPLES]
+            self._pending = self._pending[FRAME_SAMPLES:]
+            segment = self._process_frame(frame)
+            if segment is not None:
+                segments.append(segment)
+        return segments
+
+    def flush(self) -> Optional[np.ndarray]:
+        """Close the current segment at end of stream, however short its speech"""
+        if len(self._pending):
+            self._frames.append(self._pending)
+            self._pending = np.zeros(0, dtype=np.float32)
+        return self._close_segment(min_speech_frames=1)
+
+    def _process_frame(self, frame: np.ndarray) -> Optional[np.ndarray]:
+        is_speech = float(np.sqrt(np.mean(frame * frame))) >= self.energy_threshold
+        self._frames.append(frame)
+
+        if not self._in_speech:
+            if is_speech:
+                self._in_speech = True
+                self._speech_frames = 1
+                self._trailing_silence = 0
+            else:
+                # Keep a short lead-in so word onsets are not clipped
+                self._frames = self._frames[-self.pre_speech_frames:]
+            return None
+
+        if is_speech:
+            self._speech_frames += 1
+            self._trailing_silence = 0
+        else:
+            self._trailing_silence += 1
+
+        if self._trailing_silence >= self.silence_frames or len(self._frames) >= self.max_segment_frames:
+            return self._close_segment()
+        return None
+
+    def _close_segment(self, min_speech_frames: Optional[int] = None) -> Optional[np.ndarray]:
+        if min_speech_frames is None:
+            min_speech_frames = self.min_speech_frames
+        frames, speech_frames = self._frames, self._speech_frames
+        self._frames = []
+        self._speech_frames = 0
+        self._trailing_silence = 0
+        self._in_speech = False
+
+        if speech_frames < min_speech_frames or not frames:
+            return None
+        return np.concatenate(frames)
+
+class StreamingTranscription:
+    """
+    Incremental transcription of one streamed recording
+
+    Closed segments are transcribed on the transcription engine while more
+    audio arrives, and each result is pushed through send() as a partial
+    transcript. At end of stream only the final segment remains to be done.
+
+    At most STREAMING_MAX_PENDING_SEGMENTS segments wait for the engine at
+    once; beyond that add_chunk blocks, which stops the socket from being
+    read and pushes back on the client. Recordings are capped at
+    STREAMING_MAX_RECORDING_SECONDS.
+    """
+
+    def __init__(self, engine, send: Callable[[Dict[str, Any]], Awaitable[None]]):
+        self.engine = engine
+        self.segmenter = VoiceActivitySegmenter()
+        self.max_bytes = int(settings.STREAMING_MAX_RECORDING_SECONDS * SAMPLE_RATE * 2)
+        self._send = send
+        self._send_lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(max(1, settings.STREAMING_MAX_PENDING_SEGMENTS))
+        self._tasks: List[asyncio.Task] = []
+        self._texts: Dict[int, str] = {}
+        self._audio = bytearray()
+
+    @property
+    def transcript(self) -> str:
+        return " ".join(self._texts[idx] for idx in sorted(self._texts) if self._texts[idx])
+
+    async def add_chunk(self, chunk: bytes) -> None:
+        """Feed raw PCM16 audio; raises RecordingTooLong past the size cap"""
+        if len(self._audio) + len(chunk) > self.max_bytes:
+            raise RecordingTooLong(
+                f"Recording exceeds {settings.STREAMING_MAX_RECORDING_SECONDS}s"
+            )
+        self._audio.extend(chunk)
+        for segment in self.segmenter.feed(chunk):
+            await self._schedule(segment)
+
+    async def finish(self) -> str:
+        """Transcribe the remaining audio and return the full transcript"""
+        segment = self.segmenter.flush()
+        if segment is not None:
+            await self._schedule(segment)
+        await asyncio.gather(*self._tasks)
+        return self.transcript
+
+    def cancel(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+
+    def save_recording(self, path: str) -> None:
+        """Write the received audio as a 16 kHz mono WAV file"""
+        with wave.open(path, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(SAMPLE_RATE)
+            wav.writeframes(bytes(self._audio[:len(self._audio) - len(self._audio) % 2]))
+
+    async def _schedule(self, segment: np.ndarray) -> None:
+        await self._slots.acquire()
+        index = len(self._tasks)
+        self._tasks.append(asyncio.create_task(self._transcribe_segment(index, segment)))
+
+    async def _transcribe_segment(self, index: int, segment: np.ndarray) -> None:
+        try:
+            text = (await self.engine.transcribe(segment)).strip()
+        except Exception as e:
+            logger.error(f"Error transcribing segment {index}: {e}")
+            text = ""
+        finally:
+            self._slots.release()
+
+        self._texts[index] = text
+        try:
+            async with self._send_lock:
+                await self._send({
+                    "type": "partial",
+                    "segment": index,
+                    "text": text,
+                    "transcript": self.transcript
+                })
+        except Exception as e:
+            logger.warning(f"Could not deliver partial transcript {index}: {e}")
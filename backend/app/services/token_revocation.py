@@ -0,0 +1,163 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.revoked_token import RevokedToken
+from app.services.notifier import notify, notifier
+
+logger = logging.getLogger(__name__)
+
+TOKEN_REVOKED = "token_revoked"
+
+# Serial ids can commit out of order, so rows this recent are read again
+REFRESH_OVERLAP_SECONDS = 60
+
+class RevocationList:
+    """
+    In-memory mirror of the revoked_tokens table
+
+    Lookups are a dict membership test, so checking every authenticated
+    request costs no query. The mirror is refreshed incrementally: each
+    refresh reads only rows above an id cursor, which advances past a row
+    once it is older than REFRESH_OVERLAP_SECONDS. Entries are
+    dropped once their token has expired, since the signature check rejects
+    such tokens anyway, so memory is bounded by revocations within one token
+    lifetime.
+    """
+
+    def __init__(self):
+        self._expires: Dict[str, float] = {}  # jti -> token exp (epoch seconds)
+        self._cursor = 0
+        self._loaded = False
+        self._last_refresh: Optional[float] = None
+        self._last_prune = 0.0
+
+    def is_revoked(self, jti: Optional[str]) -> bool:
+        return jti is not None and jti in self._expires
+
+    def add(self, jti: str, expires: float) -> None:
+        self._expires[jti] = expires
+
+    def prune(self) -> int:
+        """Forget revocations of tokens that have expired; returns entries removed"""
+        now = time.time()
+        expired = [jti for jti, expires in self._expires.items() if expires <= now]
+        for jti in expired:
+            del self._expires[jti]
+        return len(expired)
+
+    async def refresh(self, db: AsyncSession) -> int:
+        """Load revocations added since the last refresh; returns rows read"""
+        query = (
+            select(RevokedToken.id, RevokedToken.jti, RevokedToken.expires_at, RevokedToken.revoked_at)
+            .where(RevokedToken.id > self._cursor)
+            .order_by(RevokedToken.id)
+        )
+        if not self._loaded:
+            query = query.where(RevokedToken.expires_at > datetime.utcnow())
+
+        result = await db.execute(query)
+        rows = result.all()
+        settled_before = datetime.utcnow() - timedelta(seconds=REFRESH_OVERLAP_SECONDS)
+        settled = True
+        for row in rows:
+            self.add(row.jti, _epoch(row.expires_at))
+            settled = settled and row.revoked_at <= settled_before
+            if settled:
+                self._cursor = row.id
+        self._loaded = True
+        self._last_refresh = time.time()
+        self.prune()
+        return len(rows)
+
+    async def run(self) -> None:
+        """
+        Keep the mirror current until cancelled
+
+        Refreshes immediately when another process revokes a token, and every
+        TOKEN_REVOCATION_REFRESH_SECONDS in case a notification was missed.
+        Expired rows are deleted every TOKEN_REVOCATION_PRUNE_SECONDS.
+        """
+        try:
+            revoked = await notifier.subscribe(TOKEN_REVOKED)
+        except Exception as e:
+            logger.warning(f"Revocation notifications unavailable, polling only: {e}")
+            revoked = None
+
+        try:
+            while True:
+                try:
+                    async with AsyncSessionLocal() as db:
+                        await self.refresh(db)
+                        if time.time() - self._last_prune >= settings.TOKEN_REVOCATION_PRUNE_SECONDS:
+                            await delete_expired(db)
+                            await db.commit()
+                            self._last_prune = time.time()
+                except Exception as e:
+                    logger.error(f"Error refreshing revoked tokens: {e}")
+
+                try:
+                    if revoked is not None:
+                        await asyncio.wait_for(revoked.get(), timeout=settings.TOKEN_REVOCATION_REFRESH_SECONDS)
+                    else:
+                        await asyncio.sleep(settings.TOKEN_REVOCATION_REFRESH_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            if revoked is not None:
+                notifier.unsubscribe(TOKEN_REVOKED, revoked)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return mirror size and freshness for monitoring"""
+        return {
+            "entries": len(self._expires),
+            "cursor": self._cursor,
+            "seconds_since_refresh": round(time.time() - self._last_refresh, 1) if self._last_refresh else None
+        }
+
+def _epoch(value: datetime) -> float:
+    return (value - datetime(1970, 1, 1)).total_seconds()
+
+async def revoke_token(db: AsyncSession, claims: Dict[str, Any]) -> bool:
+    """
+    Revoke a token by its verified claims; the caller commits
+
+    Takes effect in this process immediately and in others on their next
+    refresh. Returns False for tokens issued without a jti.
+    """
+    jti = claims.get("jti")
+    if jti is None:
+        return False
+
+    expires = claims.get("exp", time.time() + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+    await db.execute(
+        insert(RevokedToken)
+        .values(
+            jti=jti,
+            user_id=int(claims["sub"]) if claims.get("sub") else None,
+            expires_at=datetime(1970, 1, 1) + timedelta(seconds=expires),
+            revoked_at=datetime.utcnow()
+        )
+        .on_conflict_do_nothing(index_elements=[RevokedToken.jti])
+    )
+    await notify(db, TOKEN_REVOKED, {"jti": jti})
+    revocation_list.add(jti, expires)
+    return True
+
+async def delete_expired(db: AsyncSession) -> int:
+    """Delete revocations of tokens that have expired; the caller commits"""
+    result = await db.execute(
+        delete(RevokedToken).where(RevokedToken.expires_at <= datetime.utcnow())
+    )
+    return result.rowcount
+
+# One mirror per process
+revocation_list = RevocationList()
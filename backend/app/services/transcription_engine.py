@@ -0,0 +1,176 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
+
+from app.config import settings
+from app.services.audio_preprocessor import load_audio
+
+logger = logging.getLogger(__name__)
+
+class WhisperBackend:
+    """Reference openai-whisper (PyTorch) implementation"""
+
+    name = "whisper"
+
+    def __init__(self, model_size: str):
+        self.model_size = model_size
+        self.model = None
+
+    def load(self) -> None:
+        import whisper
+        self.model = whisper.load_model(self.model_size)
+
+    def transcribe(self, audio) -> str:
+        return self.model.transcribe(audio)["text"]
+
+class FasterWhisperBackend:
+    """CTranslate2 implementation with quantized weights, suited to CPU-only nodes"""
+
+    name = "faster_whisper"
+
+    def __init__(self, model_size: str, compute_type: str = "int8", cpu_threads: int = 0):
+        self.model_size = model_size
+        self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
+        self.model = None
+
+    def load(self) -> None:
+        from faster_whisper import WhisperModel
+        self.model = WhisperModel(
+            self.model_size,
+            device="cpu",
+            compute_type=self.compute_type,
+            cpu_threads=self.cpu_threads
+        )
+
+    def transcribe(self, audio) -> str:
+        segments, _ = self.model.transcribe(audio)
+        return "".join(segment.text for segment in segments)
+
+TRANSCRIPTION_BACKENDS = {
+    WhisperBackend.name: WhisperBackend,
+    FasterWhisperBackend.name: FasterWhisperBackend
+}
+
+def create_backend(name: str, model_size: str):
+    """Instantiate a transcription backend by name"""
+    if name == FasterWhisperBackend.name:
+        return FasterWhisperBackend(
+            model_size,
+            compute_type=settings.TRANSCRIPTION_COMPUTE_TYPE,
+            cpu_threads=settings.TRANSCRIPTION_CPU_THREADS
+        )
+    if name not in TRANSCRIPTION_BACKENDS:
+        raise ValueError(f"Unknown transcription backend: {name}")
+    return TRANSCRIPTION_BACKENDS[name](model_size)
+
+class TranscriptionEngine:
+    """
+    Process-wide speech-to-text model with a dedicated inference executor
+
+    The model is loaded once per worker process, either eagerly via load()
+    at startup or lazily on the first transcription. Inference runs on the
+    engine's own threads so it never blocks the event loop.
+    """
+
+    def __init__(self, backend, workers: int = 1):
+        self.backend = backend
+        self._loaded = False
+        self._load_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="transcribe")
+        self._pending = 0
+        self._stats = {
+            "load_seconds": None,
+            "transcriptions": 0,
+            "failures": 0,
+            "inference_seconds_total": 0.0,
+            "last_inference_seconds": None
+        }
+
+    @property
+    def ready(self) -> bool:
+        return self._loaded
+
+    @property
+    def pending(self) -> int:
+        """Transcriptions queued or running on the executor"""
+        return self._pending
+
+    def _ensure_model(self) -> None:
+        if self._loaded:
+            return
+
+        with self._load_lock:
+            if not self._loaded:
+                started = time.perf_counter()
+                self.backend.load()
+                self._stats["load_seconds"] = round(time.perf_counter() - started, 3)
+                self._loaded = True
+                logger.info(
+                    f"Loaded {self.backend.name} model '{self.backend.model_size}' "
+                    f"in {self._stats['load_seconds']}s"
+                )
+
+    def _transcribe_sync(self, audio) -> str:
+        self._ensure_model()
+        if isinstance(audio, str):
+            # Decoded samples are cached per recording, so re-analysis skips ffmpeg
+            audio = load_audio(audio)
+        started = time.perf_counter()
+        text = self.backend.transcribe(audio)
+        elapsed = time.perf_counter() - started
+
+        self._stats["transcriptions"] += 1
+        self._stats["inference_seconds_total"] += elapsed
+        self._stats["last_inference_seconds"] = round(elapsed, 3)
+        return text
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        self._pending += 1
+        try:
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
+
+    async def load(self) -> None:
+        """Load the model on the executor without blocking the event loop"""
+        try:
+            await self._run(self._ensure_model)
+        except Exception as e:
+            logger.error(f"Error loading transcription model: {e}")
+
+    async def transcribe(self, audio) -> str:
+        """Transcribe an audio file path or 16 kHz mono float32 samples"""
+        try:
+            return await self._run(self._transcribe_sync, audio)
+        except Exception:
+            self._stats["failures"] += 1
+            raise
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Load/inference timings and readiness for monitoring"""
+        count = self._stats["transcriptions"]
+        return {
+            "backend": self.backend.name,
+            "model_size": self.backend.model_size,
+            "ready": self.ready,
+            "pending": self._pending,
+            "load_seconds": self._stats["load_seconds"],
+            "transcriptions": count,
+            "failures": self._stats["failures"],
+            "avg_inference_seconds": round(self._stats["inference_seconds_total"] / count, 3) if count else None,
+            "last_inference_seconds": self._stats["last_inference_seconds"]
+        }
+
+# One engine per worker process
+transcription_engine = TranscriptionEngine(
+    create_backend(settings.TRANSCRIPTION_BACKEND, settings.WHISPER_MODEL_SIZE),
+    workers=settings.TRANSCRIPTION_WORKERS
+)
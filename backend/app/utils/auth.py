@@ -0,0 +1,149 @@
+import json
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy import event, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import get_db
+from app.models.user import User
+from app.services.notifier import USER_CHANGED, notifier
+from app.services.token_revocation import revocation_list
+from app.utils.cache import TTLCache
+from app.utils.security import decode_token
+
+logger = logging.getLogger(__name__)
+
+security = HTTPBearer()
+
+# Verified JWT claims by token, never kept past the token's own expiry
+_claims_cache = TTLCache(
+    max_entries=settings.AUTH_TOKEN_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AUTH_TOKEN_CACHE_TTL_SECONDS
+)
+
+# Profile fields by user id. ORM updates evict the entry in every process
+# (see _invalidate_user); changes made with bulk UPDATEs or plain SQL are
+# only picked up when the entry expires, so AUTH_USER_CACHE_TTL_SECONDS
+# bounds how stale is_active and email can be.
+_user_cache = TTLCache(
+    max_entries=settings.AUTH_USER_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AUTH_USER_CACHE_TTL_SECONDS
+)
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user(mapper, connection, target) -> None:
+    _user_cache.pop(target.id)
+    # Delivered on commit to sync_user_invalidations in the other processes
+    connection.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": USER_CHANGED, "payload": json.dumps({"id": target.id})}
+    )
+
+async def sync_user_invalidations() -> None:
+    """Evict users changed by other processes until cancelled"""
+    try:
+        changed = await notifier.subscribe(USER_CHANGED)
+    except Exception as e:
+        logger.warning(f"User change notifications unavailable, relying on cache TTL: {e}")
+        return
+
+    try:
+        while True:
+            payload = await changed.get()
+            _user_cache.pop(payload.get("id"))
+    finally:
+        notifier.unsubscribe(USER_CHANGED, changed)
+
+def get_token_claims(token: str) -> Optional[Dict[str, Any]]:
+    """
+    Decode and verify a JWT, reusing earlier verifications of the same token
+
+    Returns None for invalid, expired or revoked tokens.
+    """
+    claims = _claims_cache.get(token)
+    if claims is None:
+        claims = decode_token(token)
+        if claims is None:
+            return None
+        _cache_claims(token, claims)
+
+    # Checked on every call, so a revocation also applies to cached tokens
+    if revocation_list.is_revoked(claims.get("jti")):
+        return None
+    return claims
+
+def _cache_claims(token: str, claims: Dict[str, Any]) -> None:
+    ttl = settings.AUTH_TOKEN_CACHE_TTL_SECONDS
+    if "exp" in claims:
+        ttl = min(ttl, claims["exp"] - time.time())
+    _claims_cache.set(token, claims, ttl_seconds=ttl)
+
+async def get_current_user_id(credentials: HTTPAuthorizationCredentials = Depends(security)) -> int:
+    """Extract user ID from JWT token"""
+    payload = get_token_claims(credentials.credentials)
+
+    if not payload:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token"
+        )
+
+    return int(payload.get("sub"))
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db)
+) -> Dict[str, Any]:
+    """
+    Profile of the authenticated user (id, email, full_name, is_active)
+
+    Served from the user cache when possible, so repeated requests cost
+    neither signature verification nor a query.
+    """
+    user_id = await get_current_user_id(credentials)
+
+    user = _user_cache.get(user_id)
+    if user is not None:
+        return user
+
+    result = await db.execute(
+        select(User.id, User.email, User.full_name, User.is_active).where(User.id == user_id)
+    )
+    row = result.first()
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+
+    user = dict(row._mapping)
+    _user_cache.set(user_id, user)
+    return user
+
+async def get_active_user_id(credentials: HTTPAuthorizationCredentials, db: AsyncSession) -> int:
+    """
+    Like get_current_user_id, but also rejects deactivated accounts
+
+    For routes that write data or start expensive work; the active flag is
+    at most AUTH_USER_CACHE_TTL_SECONDS stale.
+    """
+    user = await get_current_user(credentials, db)
+    if not user["is_active"]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User account is inactive"
+        )
+    return user["id"]
+
+def get_auth_cache_stats() -> Dict[str, Any]:
+    """Hit ratios of the token and user caches"""
+    return {
+        "tokens": _claims_cache.stats(),
+        "users": _user_cache.stats()
+    }
@@ -0,0 +1,94 @@
+import threading
+import time
+from typing import Any, Dict
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker with a latency SLO
+
+    Calls slower than the SLO count as failures. After failure_threshold
+    consecutive failures the breaker opens and rejects calls for
+    reset_seconds, then lets a single trial call through (half-open).
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_seconds: float = 30,
+                 latency_slo_seconds: float = None):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.latency_slo_seconds = latency_slo_seconds
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+        self.rejected = 0
+        self.failures = 0
+        self.slo_breaches = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_seconds:
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Return True if a call may proceed, reserving the trial slot when half-open"""
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self, latency_seconds: float = 0.0) -> None:
+        """Record a completed call; calls over the SLO count as failures"""
+        if self.latency_slo_seconds and latency_seconds > self.latency_slo_seconds:
+            with self._lock:
+                self.slo_breaches += 1
+            self.record_failure()
+            return
+
+        with self._lock:
+            self._consecutive_failures = 0
+            self._trial_in_flight = False
+            self._state = self.CLOSED
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the breaker at the threshold"""
+        with self._lock:
+            self.failures += 1
+            self._consecutive_failures += 1
+            state = self._current_state()
+            if state == self.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                if state != self.OPEN:
+                    self.times_opened += 1
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        """Return state and counters for monitoring"""
+        return {
+            "name": self.name,
+            "state": self.state,
+            "consecutive_failures": self._consecutive_failures,
+            "failures": self.failures,
+            "slo_breaches": self.slo_breaches,
+            "rejected": self.rejected,
+            "times_opened": self.times_opened
+        }
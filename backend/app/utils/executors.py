@@ -0,0 +1,105 @@
+import asyncio
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+
+class ExecutorSaturated(Exception):
+    """Raised when a bounded executor's queue is full"""
+
+    def __init__(self, name: str, retry_after: int):
+        super().__init__(f"{name} executor is saturated")
+        self.retry_after = retry_after
+
+
+class BoundedExecutor:
+    """
+    Thread pool with admission control for CPU-bound calls from async code
+
+    At most workers calls run at once and at most max_queue more wait for a
+    thread; further calls are rejected immediately with ExecutorSaturated
+    instead of queueing without bound. Durations are recorded per operation
+    name so the queue wait can be estimated for Retry-After.
+    """
+
+    def __init__(self, name: str, workers: int = 2, max_queue: int = 32):
+        self.name = name
+        self.workers = max(1, workers)
+        self.max_queue = max(0, max_queue)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=name)
+        self._in_flight = 0
+        self.rejected = 0
+        self._timings: Dict[str, Dict[str, float]] = {}
+        self._timings_lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Calls running or waiting for a thread"""
+        return self._in_flight
+
+    @property
+    def saturated(self) -> bool:
+        """True when the next call would be rejected"""
+        return self._in_flight >= self.workers + self.max_queue
+
+    @property
+    def queued(self) -> int:
+        return max(0, self._in_flight - self.workers)
+
+    def retry_after(self) -> int:
+        """Seconds until a queued call would likely start"""
+        calls = sum(t["calls"] for t in self._timings.values())
+        seconds = sum(t["seconds_total"] for t in self._timings.values())
+        average = seconds / calls if calls else 1.0
+        return max(1, math.ceil(average * (self.queued + 1) / self.workers))
+
+    async def run(self, operation: str, func: Callable[..., Any], *args) -> Any:
+        """Run func(*args) on the pool, or raise ExecutorSaturated if the queue is full"""
+        if self.saturated:
+            self.rejected += 1
+            raise ExecutorSaturated(self.name, self.retry_after())
+
+        loop = asyncio.get_running_loop()
+        self._in_flight += 1
+        try:
+            return await loop.run_in_executor(self._executor, self._timed, operation, func, *args)
+        finally:
+            self._in_flight -= 1
+
+    def _timed(self, operation: str, func: Callable[..., Any], *args) -> Any:
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._timings_lock:
+                timing = self._timings.setdefault(
+                    operation, {"calls": 0, "seconds_total": 0.0, "max_seconds": 0.0}
+                )
+                timing["calls"] += 1
+                timing["seconds_total"] += elapsed
+                timing["max_seconds"] = max(timing["max_seconds"], elapsed)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return load and per-operation timings for monitoring"""
+        return {
+            "name": self.name,
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "running": min(self._in_flight, self.workers),
+            "queued": self.queued,
+            "rejected": self.rejected,
+            "operations": {
+                operation: {
+                    "calls": int(t["calls"]),
+                    "avg_seconds": round(t["seconds_total"] / t["calls"], 4) if t["calls"] else None,
+                    "max_seconds": round(t["max_seconds"], 4)
+                }
+                for operation, t in self._timings.items()
+            }
+        }
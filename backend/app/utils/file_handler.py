@@ -10,7 +10,9 @@ def ensure_directories():
     directories = [
         settings.UPLOAD_DIR,
         settings.GENERATED_DIR,
-        settings.RECORDINGS_DIR
+        settings.RECORDINGS_DIR,
+        settings.AUDIO_CACHE_DIR,
+        settings.LLM_CACHE_DIR
     ]
     
     for directory in directories:
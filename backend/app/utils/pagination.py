@@ -0,0 +1,42 @@
+import base64
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple
+
+from sqlalchemy import Select, tuple_
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Opaque cursor for the position after (created_at, id)"""
+    raw = f"{created_at.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Inverse of encode_cursor; raises ValueError for malformed cursors"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, row_id = raw.split("|")
+        return datetime.fromisoformat(created_at), int(row_id)
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+def keyset_page(query: Select, created_at_column, id_column, cursor: Optional[str], limit: int) -> Select:
+    """
+    Newest-first page of query after cursor
+
+    Filters on the (created_at, id) row value instead of OFFSET, so every
+    page is an index range scan regardless of depth. One extra row is
+    fetched to tell whether another page follows.
+    """
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.where(tuple_(created_at_column, id_column) < tuple_(created_at, row_id))
+    return query.order_by(created_at_column.desc(), id_column.desc()).limit(limit + 1)
+
+def split_page(rows: Sequence[Any], limit: int) -> Tuple[Sequence[Any], Optional[str]]:
+    """Trim the look-ahead row; return the page and the next cursor, if any"""
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    return page, encode_cursor(page[-1].created_at, page[-1].id)
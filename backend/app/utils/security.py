@@ -1,12 +1,21 @@
 from passlib.context import CryptContext
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
+import uuid
 import jwt
 from app.config import settings
+from app.utils.executors import BoundedExecutor
 
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt is deliberately slow; run it off the event loop with bounded admission
+auth_executor = BoundedExecutor(
+    "auth_crypto",
+    workers=settings.AUTH_CRYPTO_WORKERS,
+    max_queue=settings.AUTH_CRYPTO_MAX_QUEUE
+)
+
 def hash_password(password: str) -> str:
     """Hash a password"""
     return pwd_context.hash(password)
@@ -15,6 +24,20 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
     return pwd_context.verify(plain_password, hashed_password)
 
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the auth executor; raises ExecutorSaturated when busy"""
+    return await auth_executor.run("hash", pwd_context.hash, password)
+
+async def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password on the auth executor
+
+    Returns (valid, new_hash); new_hash is set when the stored hash uses
+    outdated parameters and should be replaced. Raises ExecutorSaturated
+    when busy.
+    """
+    return await auth_executor.run("verify", pwd_context.verify_and_update, plain_password, hashed_password)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token"""
     to_encode = data.copy()
@@ -23,7 +46,8 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
-    to_encode.update({"exp": expire})
+    # jti identifies the token for revocation on logout
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
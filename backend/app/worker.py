@@ -0,0 +1,162 @@
+"""
+Background job worker.
+
+Claims jobs from the Postgres-backed queue (app.services.job_queue) and runs
+them with the handlers in app.services.job_handlers. Claims use
+FOR UPDATE SKIP LOCKED, so any number of worker processes can run next to
+the API. Each job type runs at most JOB_CONCURRENCY[type] jobs at a time per
+process; types in JOB_MAX_RUNNING are also capped across all processes at
+claim time, so adding replicas does not multiply e.g. concurrent LLM calls.
+Types are polled in JOB_PRIORITIES order, and failed jobs are
+retried with exponential backoff. A job whose worker dies becomes claimable
+again after JOB_VISIBILITY_TIMEOUT_SECONDS.
+
+Usage (from backend/):
+    python -m app.worker [--types analyze_response,parse_resume]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+import time
+import uuid
+from typing import Dict, List, Set
+
+from app.config import settings
+from app.services import job_queue
+from app.services.job_handlers import JOB_HANDLERS
+from app.services.notifier import JOB_ENQUEUED, notifier
+
+logger = logging.getLogger(__name__)
+
+class Worker:
+    """Claim loop with per-type concurrency limits"""
+
+    def __init__(self, job_types: List[str]):
+        self.job_types = sorted(job_types, key=lambda t: settings.JOB_PRIORITIES.get(t, 0), reverse=True)
+        self.limits = {t: max(1, settings.JOB_CONCURRENCY.get(t, 1)) for t in self.job_types}
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.active: Dict[str, Set[asyncio.Task]] = {t: set() for t in self.job_types}
+        self.stopping = asyncio.Event()
+        self.wakeup = asyncio.Event()
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self.stopping.set)
+
+        relay_task = await self._listen_for_jobs()
+        logger.info(f"Worker {self.worker_id} serving {', '.join(f'{t}x{self.limits[t]}' for t in self.job_types)}")
+
+        while not self.stopping.is_set():
+            claimed_any = False
+            for job_type in self.job_types:
+                free = self.limits[job_type] - len(self.active[job_type])
+                if free <= 0:
+                    continue
+                try:
+                    jobs = await job_queue.claim(job_type, free, self.worker_id)
+                except Exception as e:
+                    logger.error(f"Error claiming {job_type} jobs: {e}")
+                    jobs = []
+                for job in jobs:
+                    self._start(job)
+                claimed_any = claimed_any or bool(jobs)
+
+            if claimed_any:
+                continue
+
+            # Sleep until a job is enqueued, a slot frees up, or the poll interval passes
+            self.wakeup.clear()
+            waiters = [asyncio.create_task(self.wakeup.wait()), asyncio.create_task(self.stopping.wait())]
+            running = [task for tasks in self.active.values() for task in tasks]
+            await asyncio.wait(
+                waiters + running,
+                timeout=settings.JOB_POLL_SECONDS,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            for waiter in waiters:
+                waiter.cancel()
+
+        running = [task for tasks in self.active.values() for task in tasks]
+        logger.info(f"Stopping; waiting for {len(running)} jobs in progress")
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+        if relay_task is not None:
+            relay_task.cancel()
+        await notifier.close()
+
+    async def _listen_for_jobs(self):
+        try:
+            enqueued = await notifier.subscribe(JOB_ENQUEUED)
+        except Exception as e:
+            logger.warning(f"Notifications unavailable, polling only: {e}")
+            return None
+
+        async def relay():
+            while True:
+                event = await enqueued.get()
+                if event.get("job_type") in self.limits:
+                    self.wakeup.set()
+
+        return asyncio.create_task(relay())
+
+    def _start(self, job: job_queue.ClaimedJob) -> None:
+        task = asyncio.create_task(self._execute(job))
+        self.active[job.job_type].add(task)
+        task.add_done_callback(self.active[job.job_type].discard)
+
+    async def _execute(self, job: job_queue.ClaimedJob) -> None:
+        if job.attempts > job.max_attempts:
+            # Reclaimed after its worker died on the final attempt
+            await job_queue.fail(job, self.worker_id, "Exceeded max attempts", permanent=True)
+            return
+
+        keepalive = asyncio.create_task(self._heartbeat(job.id))
+        started = time.perf_counter()
+        try:
+            result = await JOB_HANDLERS[job.job_type](job.payload)
+            await job_queue.complete(job.id, self.worker_id, result)
+            logger.info(f"Job {job.id} ({job.job_type}) done in {time.perf_counter() - started:.2f}s")
+        except job_queue.PermanentJobError as e:
+            await job_queue.fail(job, self.worker_id, str(e), permanent=True)
+        except Exception as e:
+            try:
+                await job_queue.fail(job, self.worker_id, f"{type(e).__name__}: {e}")
+            except Exception as fail_error:
+                # The claim expires and the job is retried by whichever worker claims it next
+                logger.error(f"Could not record failure of job {job.id}: {fail_error}")
+        finally:
+            keepalive.cancel()
+
+    async def _heartbeat(self, job_id: int) -> None:
+        """Keep long-running jobs invisible to other workers"""
+        interval = settings.JOB_VISIBILITY_TIMEOUT_SECONDS / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not await job_queue.heartbeat(job_id, self.worker_id):
+                    logger.warning(f"Lost claim on job {job_id}")
+                    return
+            except Exception as e:
+                logger.warning(f"Heartbeat for job {job_id} failed: {e}")
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--types",
+        default=",".join(JOB_HANDLERS),
+        help="comma-separated job types to run (default: all)"
+    )
+    args = parser.parse_args()
+
+    job_types = [t for t in args.types.split(",") if t]
+    unknown = [t for t in job_types if t not in JOB_HANDLERS]
+    if unknown:
+        parser.error(f"Unknown job types: {', '.join(unknown)}")
+
+    asyncio.run(Worker(job_types).run())
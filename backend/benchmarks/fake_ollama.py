@@ -0,0 +1,186 @@
+"""
+Local stand-in for the Ollama /api/generate endpoint.
+
+Simulates prefill and decode time from a configurable token rate, adds
+per-request latency drawn from a fixed, uniform or lognormal distribution,
+and injects errors at a configurable rate. The number of requests served at
+once is capped like OLLAMA_NUM_PARALLEL; time spent waiting for a slot is
+recorded and exposed on GET /_stats (reset with POST /_stats/reset).
+
+Usage (from backend/):
+    python -m benchmarks.fake_ollama --port 11435 --token-rate 40 --latency-dist lognormal --latency-ms 200
+    OLLAMA_BASE_URL=http://localhost:11435 python -m benchmarks.llm_load
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+@dataclass
+class FakeOllamaConfig:
+    token_rate: float = 40.0  # generated tokens per second
+    prompt_eval_rate: float = 800.0  # prefilled tokens per second
+    response_tokens: int = 80
+    latency_dist: str = "fixed"  # fixed, uniform, lognormal
+    latency_ms: float = 50.0
+    latency_sigma: float = 0.5
+    error_rate: float = 0.0
+    parallel: int = 4
+    seed: int = None
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+def create_app(config: FakeOllamaConfig) -> FastAPI:
+    """Build the fake server for the given configuration"""
+    app = FastAPI(title="Fake Ollama")
+    rng = random.Random(config.seed)
+    slots = asyncio.Semaphore(config.parallel)
+    stats: Dict[str, Any] = {"requests": 0, "errors": 0, "queue_ms": []}
+
+    def base_latency() -> float:
+        if config.latency_dist == "uniform":
+            return rng.uniform(0, 2 * config.latency_ms) / 1000
+        if config.latency_dist == "lognormal":
+            return rng.lognormvariate(0, config.latency_sigma) * config.latency_ms / 1000
+        return config.latency_ms / 1000
+
+    def response_tokens(prompt: str) -> List[str]:
+        if "SCORE" in prompt or "Candidate's Answer" in prompt:
+            text = (
+                f"SCORE: {rng.randint(40, 95)}\nSTRENGTHS:\n- Clear structure\n- Relevant example\n"
+                "IMPROVEMENTS:\n- Quantify the impact\n- Mention trade-offs\n"
+                "FEEDBACK: Solid answer that would benefit from concrete metrics."
+            )
+            return [word + " " for word in text.split(" ")]
+        return [f"token{i} " for i in range(config.response_tokens)]
+
+    @app.get("/_stats")
+    async def get_stats():
+        queue = stats["queue_ms"]
+        return {
+            "requests": stats["requests"],
+            "errors": stats["errors"],
+            "queue_ms": {
+                "p50": _percentile(queue, 50),
+                "p95": _percentile(queue, 95),
+                "p99": _percentile(queue, 99),
+                "max": max(queue) if queue else 0.0
+            }
+        }
+
+    @app.post("/_stats/reset")
+    async def reset_stats():
+        stats.update({"requests": 0, "errors": 0, "queue_ms": []})
+        return {"status": "reset"}
+
+    @app.post("/api/generate")
+    async def generate(request: Request):
+        body = await request.json()
+        model = body.get("model", "fake")
+        prompt = body.get("prompt", "")
+        context = body.get("context") or []
+        options = body.get("options") or {}
+        stream = body.get("stream", True)
+
+        stats["requests"] += 1
+        if rng.random() < config.error_rate:
+            stats["errors"] += 1
+            return JSONResponse(status_code=500, content={"error": "injected failure"})
+
+        queued_at = time.perf_counter()
+        await slots.acquire()
+        stats["queue_ms"].append((time.perf_counter() - queued_at) * 1000)
+
+        # Only the new prompt is prefilled; tokens in context are already evaluated
+        prompt_tokens = max(1, len(prompt.split()))
+        prompt_eval_s = prompt_tokens / config.prompt_eval_rate
+        tokens = response_tokens(prompt)
+        if "num_predict" in options:
+            tokens = tokens[:max(0, options["num_predict"])]
+        new_context = context + [rng.randint(0, 32000) for _ in range(prompt_tokens + len(tokens))]
+
+        def final_chunk(eval_s: float, total_s: float, text: str) -> Dict[str, Any]:
+            return {
+                "model": model,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "response": text,
+                "done": True,
+                "context": new_context,
+                "total_duration": int(total_s * 1e9),
+                "prompt_eval_count": prompt_tokens,
+                "prompt_eval_duration": int(prompt_eval_s * 1e9),
+                "eval_count": len(tokens),
+                "eval_duration": int(eval_s * 1e9)
+            }
+
+        if not stream:
+            try:
+                started = time.perf_counter()
+                eval_s = len(tokens) / config.token_rate
+                await asyncio.sleep(base_latency() + prompt_eval_s + eval_s)
+                return final_chunk(eval_s, time.perf_counter() - started, "".join(tokens))
+            finally:
+                slots.release()
+
+        async def stream_tokens():
+            try:
+                started = time.perf_counter()
+                await asyncio.sleep(base_latency() + prompt_eval_s)
+                for token in tokens:
+                    await asyncio.sleep(1 / config.token_rate)
+                    yield json.dumps({
+                        "model": model,
+                        "created_at": datetime.now(timezone.utc).isoformat(),
+                        "response": token,
+                        "done": False
+                    }) + "\n"
+                eval_s = len(tokens) / config.token_rate
+                yield json.dumps(final_chunk(eval_s, time.perf_counter() - started, "")) + "\n"
+            finally:
+                slots.release()
+
+        return StreamingResponse(stream_tokens(), media_type="application/x-ndjson")
+
+    return app
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11435)
+    parser.add_argument("--token-rate", type=float, default=40.0)
+    parser.add_argument("--prompt-eval-rate", type=float, default=800.0)
+    parser.add_argument("--response-tokens", type=int, default=80)
+    parser.add_argument("--latency-dist", choices=["fixed", "uniform", "lognormal"], default="fixed")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--parallel", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config = FakeOllamaConfig(
+        token_rate=args.token_rate,
+        prompt_eval_rate=args.prompt_eval_rate,
+        response_tokens=args.response_tokens,
+        latency_dist=args.latency_dist,
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        parallel=args.parallel,
+        seed=args.seed
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
@@ -0,0 +1,89 @@
+"""
+Measure prompt-eval time saved by reusing per-interview LLM context.
+
+Runs the same synthetic interviews through speech_analyzer.analyze_response
+twice: once sending the full job description with every answer, and once
+with interview_id set so the job description is evaluated once per interview.
+Prompt-eval counters come from the timings Ollama reports with each response.
+
+Usage (from backend/):
+    OLLAMA_BASE_URL=http://localhost:11434 python -m benchmarks.llm_context_reuse --interviews 5 --answers 5
+"""
+import argparse
+import asyncio
+import time
+import uuid
+
+from app.services.llm_service import get_llm_stats
+from app.services.speech_analyzer import analyze_response
+
+JOB_DESCRIPTION = (
+    "We are hiring a backend engineer to design, build and operate Python services "
+    "on PostgreSQL. You will own REST APIs built with FastAPI, write efficient SQL, "
+    "profile and optimize slow endpoints, and mentor junior engineers. Experience "
+    "with asynchronous programming, caching strategies, message queues, Docker and "
+    "cloud deployments is expected. Strong communication skills and the ability to "
+    "lead cross-team technical decisions are a plus. "
+) * 8
+
+QUESTIONS = [
+    "Tell me about a time you had to meet a tight deadline.",
+    "How would you optimize a slow database query?",
+    "Explain the difference between synchronous and asynchronous programming.",
+    "Describe a situation where you had to lead a team through a major challenge.",
+    "How would you implement caching in a distributed system?",
+]
+
+ANSWER = (
+    "In my last project I profiled the endpoint, found an N+1 query, replaced it with "
+    "a single join and added an index, which reduced p95 latency by 60 percent."
+)
+
+async def run_interviews(interviews: int, answers: int, reuse: bool) -> dict:
+    before = get_llm_stats()
+    start = time.perf_counter()
+
+    for _ in range(interviews):
+        # Unique marker so neither the cache nor a previous session can help
+        marker = uuid.uuid4().hex
+        job_description = f"{JOB_DESCRIPTION}\nPosting reference: {marker}"
+        interview_id = marker if reuse else None
+        for idx in range(answers):
+            await analyze_response(
+                question=QUESTIONS[idx % len(QUESTIONS)],
+                answer=ANSWER,
+                job_description=job_description,
+                use_cache=False,
+                interview_id=interview_id
+            )
+
+    elapsed = time.perf_counter() - start
+    after = get_llm_stats()
+    return {
+        "prompt_eval_ms": after["prompt_eval_ms"] - before["prompt_eval_ms"],
+        "prompt_eval_count": after["prompt_eval_count"] - before["prompt_eval_count"],
+        "wall_s": elapsed
+    }
+
+async def main(interviews: int, answers: int) -> None:
+    full = await run_interviews(interviews, answers, reuse=False)
+    reused = await run_interviews(interviews, answers, reuse=True)
+
+    print(f"{interviews} interviews x {answers} answers")
+    print(f"{'mode':<10}{'prompt tokens':>16}{'prompt eval ms':>18}{'wall s':>10}")
+    for name, result in (("full", full), ("reuse", reused)):
+        print(
+            f"{name:<10}{result['prompt_eval_count']:>16}"
+            f"{result['prompt_eval_ms']:>18.1f}{result['wall_s']:>10.2f}"
+        )
+
+    saved_ms = (full["prompt_eval_ms"] - reused["prompt_eval_ms"]) / interviews
+    saved_tokens = (full["prompt_eval_count"] - reused["prompt_eval_count"]) / interviews
+    print(f"prompt-eval saved per interview: {saved_ms:.1f} ms ({saved_tokens:.0f} tokens)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--interviews", type=int, default=5)
+    parser.add_argument("--answers", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.interviews, args.answers))
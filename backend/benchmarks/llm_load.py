@@ -0,0 +1,125 @@
+"""
+Load benchmark for generate_text and speech_analyzer.analyze_response.
+
+Drives a closed loop of concurrent callers at increasing concurrency and
+reports throughput and client latency percentiles per level. When the
+target is the fake server (benchmarks.fake_ollama), server-side queueing
+delay is read from its /_stats endpoint as well.
+
+Every request uses a unique prompt with the cache bypassed, so each call
+reaches the upstream server.
+
+Usage (from backend/):
+    python -m benchmarks.fake_ollama --port 11435 &
+    OLLAMA_BASE_URL=http://localhost:11435 python -m benchmarks.llm_load --levels 1,4,16,32 --requests 64
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from typing import Awaitable, Callable, List, Optional
+
+import httpx
+
+from app.config import settings
+from app.services.llm_service import generate_text
+from app.services.speech_analyzer import analyze_response
+
+JOB_DESCRIPTION = (
+    "Backend engineer working on Python, FastAPI and PostgreSQL services. "
+    "Owns API design, query optimization, caching and on-call operations."
+)
+
+async def call_generate() -> bool:
+    text = await generate_text(f"Summarize the request {uuid.uuid4().hex}.", use_cache=False)
+    return bool(text)
+
+async def call_analyze() -> bool:
+    analysis = await analyze_response(
+        question="How would you optimize a slow database query?",
+        answer=f"I would start with EXPLAIN ANALYZE and check the indexes. ({uuid.uuid4().hex})",
+        job_description=JOB_DESCRIPTION,
+        use_cache=False
+    )
+    return analysis.get("source") == "llm"
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+async def server_stats(client: httpx.AsyncClient, reset: bool = False) -> Optional[dict]:
+    """Queueing stats from the fake server; None against a real Ollama"""
+    try:
+        if reset:
+            await client.post(f"{settings.OLLAMA_BASE_URL}/_stats/reset")
+            return None
+        response = await client.get(f"{settings.OLLAMA_BASE_URL}/_stats")
+        return response.json() if response.status_code == 200 else None
+    except httpx.HTTPError:
+        return None
+
+async def run_level(call: Callable[[], Awaitable[bool]], concurrency: int, requests: int) -> dict:
+    latencies: List[float] = []
+    failures = 0
+    remaining = iter(range(requests))
+
+    async def worker():
+        nonlocal failures
+        for _ in remaining:
+            started = time.perf_counter()
+            ok = await call()
+            latencies.append((time.perf_counter() - started) * 1000)
+            if not ok:
+                failures += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "throughput": len(latencies) / elapsed if elapsed else 0.0,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "max": max(latencies) if latencies else 0.0,
+        "failures": failures
+    }
+
+async def main(targets: List[str], levels: List[int], requests: int) -> None:
+    calls = {"generate": call_generate, "analyze": call_analyze}
+
+    async with httpx.AsyncClient() as client:
+        for target in targets:
+            print(f"\n{target} against {settings.OLLAMA_BASE_URL}")
+            print(
+                f"{'conc':>5}{'req/s':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+                f"{'max ms':>10}{'queue p50':>11}{'queue p95':>11}{'fail':>6}"
+            )
+            for concurrency in levels:
+                await server_stats(client, reset=True)
+                result = await run_level(calls[target], concurrency, requests)
+                stats = await server_stats(client)
+                if stats:
+                    queue_p50 = f"{stats['queue_ms']['p50']:.1f}"
+                    queue_p95 = f"{stats['queue_ms']['p95']:.1f}"
+                else:
+                    queue_p50 = queue_p95 = "n/a"
+                print(
+                    f"{concurrency:>5}{result['throughput']:>9.2f}{result['p50']:>10.1f}"
+                    f"{result['p95']:>10.1f}{result['p99']:>10.1f}{result['max']:>10.1f}"
+                    f"{queue_p50:>11}{queue_p95:>11}{result['failures']:>6}"
+                )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--target", choices=["generate", "analyze", "both"], default="both")
+    parser.add_argument("--levels", default="1,2,4,8,16,32")
+    parser.add_argument("--requests", type=int, default=64, help="requests per concurrency level")
+    args = parser.parse_args()
+
+    targets = ["generate", "analyze"] if args.target == "both" else [args.target]
+    levels = [int(level) for level in args.levels.split(",")]
+    asyncio.run(main(targets, levels, args.requests))
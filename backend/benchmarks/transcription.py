@@ -0,0 +1,159 @@
+"""
+Compare transcription backends on a fixed set of local audio fixtures.
+
+Each backend runs in a fresh process so model load time and peak resident
+memory are measured in isolation. Reports load time, per-file inference
+time and real-time factor (inference seconds / audio seconds; below 1.0 is
+faster than real time).
+
+Without recordings in the fixtures directory, synthetic speech-like clips
+are generated instead. Their timings are representative, their transcripts
+are not.
+
+Usage (from backend/):
+    python -m benchmarks.transcription --backends whisper,faster_whisper --model-size base
+"""
+import argparse
+import math
+import multiprocessing
+import queue
+import random
+import resource
+import subprocess
+import struct
+import tempfile
+import time
+import wave
+from pathlib import Path
+from typing import Dict, List, Optional
+
+AUDIO_EXTENSIONS = {".wav", ".mp3", ".m4a", ".webm", ".ogg", ".flac"}
+DEFAULT_FIXTURES = Path(__file__).parent / "fixtures" / "audio"
+SYNTHETIC_SECONDS = [5, 30, 60]
+SAMPLE_RATE = 16000
+
+def synthesize_clip(path: Path, seconds: int, seed: int) -> None:
+    """
+    Write a 16 kHz mono WAV of voiced-like bursts separated by pauses
+
+    A harmonic tone with a drifting pitch and syllable-rate envelope keeps
+    the voice activity and decoding work close to that of real speech.
+    """
+    rng = random.Random(seed)
+    frames = bytearray()
+    t = 0
+    while t < seconds * SAMPLE_RATE:
+        burst = int(rng.uniform(0.8, 2.5) * SAMPLE_RATE)
+        pause = int(rng.uniform(0.2, 0.7) * SAMPLE_RATE)
+        pitch = rng.uniform(100, 220)
+        for i in range(burst):
+            envelope = 0.5 * (1 - math.cos(2 * math.pi * 4 * i / SAMPLE_RATE))
+            f0 = pitch * (1 + 0.05 * math.sin(2 * math.pi * 0.5 * i / SAMPLE_RATE))
+            sample = sum(math.sin(2 * math.pi * f0 * k * i / SAMPLE_RATE) / k for k in (1, 2, 3))
+            frames += struct.pack("<h", int(6000 * envelope * sample / 1.8))
+        frames += bytes(2 * pause)
+        t += burst + pause
+
+    with wave.open(str(path), "wb") as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(SAMPLE_RATE)
+        out.writeframes(bytes(frames[:seconds * SAMPLE_RATE * 2]))
+
+def audio_duration(path: Path) -> float:
+    """Duration in seconds, read directly for WAV and via ffprobe otherwise"""
+    if path.suffix.lower() == ".wav":
+        with wave.open(str(path), "rb") as clip:
+            return clip.getnframes() / clip.getframerate()
+    output = subprocess.run(
+        ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", str(path)],
+        capture_output=True, text=True, check=True
+    )
+    return float(output.stdout.strip())
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def run_backend(backend_name: str, model_size: str, files: List[str], results) -> None:
+    from app.services.transcription_engine import create_backend
+
+    baseline_mb = peak_rss_mb()
+    backend = create_backend(backend_name, model_size)
+
+    started = time.perf_counter()
+    backend.load()
+    load_seconds = time.perf_counter() - started
+
+    timings: Dict[str, float] = {}
+    for path in files:
+        started = time.perf_counter()
+        backend.transcribe(path)
+        timings[path] = time.perf_counter() - started
+
+    results.put({
+        "backend": backend_name,
+        "load_seconds": load_seconds,
+        "timings": timings,
+        "peak_rss_mb": peak_rss_mb(),
+        "model_rss_mb": peak_rss_mb() - baseline_mb
+    })
+
+def wait_for_result(process, results, timeout: float) -> Optional[dict]:
+    """The child's result, or None if it exits without one or runs past timeout"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            return results.get(timeout=1)
+        except queue.Empty:
+            if not process.is_alive():
+                return None
+    process.terminate()
+    return None
+
+def main(backends: List[str], model_size: str, fixtures: Path, timeout: float) -> None:
+    files = []
+    if fixtures.is_dir():
+        files = sorted(str(p) for p in fixtures.iterdir() if p.suffix.lower() in AUDIO_EXTENSIONS)
+    if not files:
+        synthetic_dir = Path(tempfile.mkdtemp(prefix="transcription_bench_"))
+        print(f"No audio fixtures in {fixtures}; using synthetic clips in {synthetic_dir}")
+        for seed, seconds in enumerate(SYNTHETIC_SECONDS):
+            path = synthetic_dir / f"synthetic_{seconds}s.wav"
+            synthesize_clip(path, seconds, seed)
+            files.append(str(path))
+
+    durations = {path: audio_duration(Path(path)) for path in files}
+    total_audio = sum(durations.values())
+    print(f"{len(files)} fixtures, {total_audio:.1f}s of audio, model size '{model_size}'")
+
+    ctx = multiprocessing.get_context("spawn")
+    for backend_name in backends:
+        results = ctx.Queue()
+        process = ctx.Process(target=run_backend, args=(backend_name, model_size, files, results))
+        process.start()
+        result = wait_for_result(process, results, timeout)
+        process.join()
+        if result is None:
+            print(f"\n{backend_name}: failed (exit code {process.exitcode}), see output above")
+            continue
+
+        total_inference = sum(result["timings"].values())
+        print(f"\n{backend_name}: load {result['load_seconds']:.2f}s, "
+              f"peak RSS {result['peak_rss_mb']:.0f} MB (+{result['model_rss_mb']:.0f} MB)")
+        print(f"{'fixture':<40}{'audio s':>10}{'infer s':>10}{'RTF':>8}")
+        for path in files:
+            seconds = result["timings"][path]
+            print(f"{Path(path).name:<40}{durations[path]:>10.1f}{seconds:>10.2f}"
+                  f"{seconds / durations[path]:>8.3f}")
+        print(f"{'total':<40}{total_audio:>10.1f}{total_inference:>10.2f}"
+              f"{total_inference / total_audio:>8.3f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--backends", default="whisper,faster_whisper")
+    parser.add_argument("--model-size", default="base")
+    parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURES)
+    parser.add_argument("--timeout", type=float, default=1800, help="seconds allowed per backend")
+    args = parser.parse_args()
+    main(args.backends.split(","), args.model_size, args.fixtures, args.timeout)
@@ -0,0 +1,4 @@
+#!/bin/sh
+# Let the local read replica (docker-compose postgres-replica) stream WAL from this primary
+set -e
+echo "host replication all all scram-sha-256" >> "$PGDATA/pg_hba.conf"
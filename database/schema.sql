@@ -34,6 +34,9 @@ CREATE TABLE IF NOT EXISTS resumes (
 -- Create index on user_id for faster lookups
 CREATE INDEX IF NOT EXISTS idx_resumes_user_id ON resumes(user_id);
 
+-- Composite index for newest-first keyset pagination of a user's resumes
+CREATE INDEX IF NOT EXISTS idx_resumes_user_created ON resumes(user_id, created_at DESC, id DESC);
+
 -- Create interviews table
 CREATE TABLE IF NOT EXISTS interviews (
     id SERIAL PRIMARY KEY,
@@ -46,6 +49,7 @@ CREATE TABLE IF NOT EXISTS interviews (
     technical_score FLOAT DEFAULT 0.0,
     duration INTEGER DEFAULT 0,
     status VARCHAR(50) DEFAULT 'in_progress',
+    report TEXT,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
@@ -53,6 +57,9 @@ CREATE TABLE IF NOT EXISTS interviews (
 -- Create index on user_id for faster lookups
 CREATE INDEX IF NOT EXISTS idx_interviews_user_id ON interviews(user_id);
 
+-- Composite index for newest-first keyset pagination of a user's interviews
+CREATE INDEX IF NOT EXISTS idx_interviews_user_created ON interviews(user_id, created_at DESC, id DESC);
+
 -- Create interview_questions table
 CREATE TABLE IF NOT EXISTS interview_questions (
     id SERIAL PRIMARY KEY,
@@ -75,9 +82,61 @@ CREATE TABLE IF NOT EXISTS interview_responses (
     duration INTEGER DEFAULT 0,
     score FLOAT DEFAULT 0.0,
     feedback TEXT,
+    status VARCHAR(50) DEFAULT 'analyzed',
+    score_source VARCHAR(20) DEFAULT 'heuristic',
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
 -- Create indexes on interview_id and question_id for faster lookups
 CREATE INDEX IF NOT EXISTS idx_interview_responses_interview_id ON interview_responses(interview_id);
 CREATE INDEX IF NOT EXISTS idx_interview_responses_question_id ON interview_responses(question_id);
+
+-- Create jobs table (background work queue, see backend/app/worker.py)
+CREATE TABLE IF NOT EXISTS jobs (
+    id SERIAL PRIMARY KEY,
+    job_type VARCHAR(100) NOT NULL,
+    payload TEXT NOT NULL,
+    priority INTEGER DEFAULT 0,
+    status VARCHAR(50) DEFAULT 'queued',
+    attempts INTEGER DEFAULT 0,
+    max_attempts INTEGER DEFAULT 5,
+    run_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    locked_until TIMESTAMP,
+    locked_by VARCHAR(255),
+    last_error TEXT,
+    result TEXT,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    finished_at TIMESTAMP
+);
+
+-- Partial index for claiming: only unfinished jobs, in claim order
+CREATE INDEX IF NOT EXISTS idx_jobs_claimable ON jobs(job_type, priority DESC, run_at, id) WHERE status IN ('queued', 'running');
+
+-- Create revoked_tokens table (logged-out access tokens until they expire)
+CREATE TABLE IF NOT EXISTS revoked_tokens (
+    id SERIAL PRIMARY KEY,
+    jti VARCHAR(64) UNIQUE NOT NULL,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    expires_at TIMESTAMP NOT NULL,
+    revoked_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Pruning deletes by expiry
+CREATE INDEX IF NOT EXISTS idx_revoked_tokens_expires_at ON revoked_tokens(expires_at);
+
+-- Create rate_limit_buckets table (token buckets shared by API workers when RATE_LIMIT_SHARED is set)
+CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+    key VARCHAR(255) PRIMARY KEY,
+    tokens DOUBLE PRECISION NOT NULL,
+    allowed BOOLEAN DEFAULT TRUE,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Columns added after the tables above were first created; no-ops on new databases
+ALTER TABLE interviews ADD COLUMN IF NOT EXISTS report TEXT;
+ALTER TABLE interview_responses ADD COLUMN IF NOT EXISTS status VARCHAR(50) DEFAULT 'analyzed';
+-- Existing rows keep a NULL score_source (unknown); only new rows get the default
+ALTER TABLE interview_responses ADD COLUMN IF NOT EXISTS score_source VARCHAR(20);
+ALTER TABLE interview_responses ALTER COLUMN score_source SET DEFAULT 'heuristic';